@@ -0,0 +1,175 @@
+"""
+Precompute placeholders and layout metadata for every card-face icon.
+
+This script:
+1) Loads src/assets/icons3d/<id>.png and, when built, src/assets/cards-raster/<id>@1x.png.
+2) Computes the tight alpha bounding box, alpha-weighted average and dominant colour
+   with vectorized NumPy over the RGBA channels.
+3) Encodes a small BlurHash of the icon composited over the card-back colour.
+4) Writes everything into one compact JSON module keyed by catalog icon id
+   (src/assets/iconPlaceholders.json), importable from the app and from later stages.
+
+Requires NumPy and Pillow.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+
+import numpy as np
+from PIL import Image
+
+from concept_catalog import DEFAULT_CATALOG, concept_ids
+
+
+BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+
+def load_rgba(path: str) -> np.ndarray:
+    with Image.open(path) as image:
+        return np.asarray(image.convert("RGBA"), dtype=np.uint8)
+
+
+def to_hex(rgb: np.ndarray) -> str:
+    r, g, b = (int(round(float(c))) for c in np.clip(rgb, 0, 255))
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def alpha_bbox(alpha: np.ndarray, threshold: int) -> list[int]:
+    mask = alpha > threshold
+    rows = np.flatnonzero(mask.any(axis=1))
+    cols = np.flatnonzero(mask.any(axis=0))
+    if rows.size == 0:
+        return [0, 0, 0, 0]
+    return [int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1)]
+
+
+def colour_stats(rgba: np.ndarray) -> tuple[str, str]:
+    rgb = rgba[..., :3].reshape(-1, 3).astype(np.float64)
+    weight = rgba[..., 3].reshape(-1).astype(np.float64)
+    total = weight.sum()
+    if total == 0:
+        return "#000000", "#000000"
+    average = (rgb * weight[:, None]).sum(axis=0) / total
+
+    # Dominant colour: heaviest 4-bit-per-channel bucket, reported as that bucket's mean.
+    quantized = rgba[..., :3].reshape(-1, 3) >> 4
+    buckets = (quantized[:, 0].astype(np.int32) << 8) | (quantized[:, 1].astype(np.int32) << 4) | quantized[:, 2]
+    heaviest = np.bincount(buckets, weights=weight, minlength=4096).argmax()
+    in_bucket = buckets == heaviest
+    dominant = (rgb[in_bucket] * weight[in_bucket, None]).sum(axis=0) / weight[in_bucket].sum()
+    return to_hex(average), to_hex(dominant)
+
+
+def encode_base83(value: int, length: int) -> str:
+    return "".join(BASE83[(value // 83 ** (length - i - 1)) % 83] for i in range(length))
+
+
+def srgb_to_linear(values: np.ndarray) -> np.ndarray:
+    v = values / 255.0
+    return np.where(v <= 0.04045, v / 12.92, ((v + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(value: float) -> int:
+    v = min(max(value, 0.0), 1.0)
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def blurhash(rgb: np.ndarray, components_x: int, components_y: int) -> str:
+    height, width, _ = rgb.shape
+    linear = srgb_to_linear(rgb.astype(np.float64))
+    basis_x = np.cos(np.pi * np.arange(components_x)[:, None] * np.arange(width)[None, :] / width)
+    basis_y = np.cos(np.pi * np.arange(components_y)[:, None] * np.arange(height)[None, :] / height)
+    factors = np.einsum("jy,ix,yxc->jic", basis_y, basis_x, linear) / (width * height)
+    factors[1:, :, :] *= 2
+    factors[0, 1:, :] *= 2
+    factors = factors.reshape(-1, 3)
+
+    dc, ac = factors[0], factors[1:]
+    result = encode_base83((components_x - 1) + (components_y - 1) * 9, 1)
+    if len(ac):
+        quantized_max = int(max(0, min(82, np.floor(np.abs(ac).max() * 166 - 0.5))))
+        max_value = (quantized_max + 1) / 166
+        result += encode_base83(quantized_max, 1)
+    else:
+        max_value = 1.0
+        result += encode_base83(0, 1)
+
+    r, g, b = (linear_to_srgb(c) for c in dc)
+    result += encode_base83((r << 16) + (g << 8) + b, 4)
+    scaled = np.sign(ac) * np.abs(ac / max_value) ** 0.5
+    quant = np.clip(np.floor(scaled * 9 + 9.5), 0, 18).astype(int)
+    for qr, qg, qb in quant:
+        result += encode_base83(qr * 19 * 19 + qg * 19 + qb, 2)
+    return result
+
+
+def analyze(path: str, background: np.ndarray, alpha_threshold: int, hash_size: int) -> dict:
+    rgba = load_rgba(path)
+    height, width = rgba.shape[:2]
+    average, dominant = colour_stats(rgba)
+
+    # BlurHash has no alpha, so flatten onto the card back at a small size first.
+    small = Image.fromarray(rgba).resize((hash_size, hash_size), Image.Resampling.BOX)
+    small_rgba = np.asarray(small, dtype=np.float64)
+    alpha = small_rgba[..., 3:] / 255.0
+    flat = small_rgba[..., :3] * alpha + background * (1.0 - alpha)
+
+    return {
+        "width": width,
+        "height": height,
+        "bbox": alpha_bbox(rgba[..., 3], alpha_threshold),
+        "average": average,
+        "dominant": dominant,
+        "blurhash": blurhash(flat, 4, 4),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG, help="Concept catalog providing the icon ids")
+    parser.add_argument("--icons-dir", default="src/assets/icons3d")
+    parser.add_argument("--rasters-dir", default="src/assets/cards-raster")
+    parser.add_argument("--output", default="src/assets/iconPlaceholders.json")
+    parser.add_argument("--background", default="#f0f0f0", help="Card-back colour used under transparent pixels")
+    parser.add_argument("--alpha-threshold", type=int, default=8)
+    parser.add_argument("--hash-size", type=int, default=32, help="Downscaled size the BlurHash is computed on")
+    args = parser.parse_args()
+
+    background = np.array([int(args.background[i : i + 2], 16) for i in (1, 3, 5)], dtype=np.float64)
+    sources = {
+        "icons3d": lambda icon_id: os.path.join(args.icons_dir, f"{icon_id}.png"),
+        "card": lambda icon_id: os.path.join(args.rasters_dir, f"{icon_id}@1x.png"),
+    }
+
+    icons: dict[str, dict] = {}
+    missing: list[str] = []
+    for icon_id in concept_ids(args.catalog):
+        entry = {}
+        for kind, path_for in sources.items():
+            path = path_for(icon_id)
+            if os.path.exists(path):
+                entry[kind] = analyze(path, background, args.alpha_threshold, args.hash_size)
+        if not entry:
+            missing.append(icon_id)
+            continue
+        icons[icon_id] = entry
+        print(f"[analyze] {icon_id}: {', '.join(entry)}")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "background": args.background, "icons": icons}, f, separators=(",", ":"))
+        f.write("\n")
+    print(f"[analyze] {len(icons)} icons -> {args.output}")
+
+    if missing:
+        print("[warn] No source image for:", ", ".join(missing))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
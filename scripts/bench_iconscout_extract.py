@@ -0,0 +1,126 @@
+"""
+Benchmark candidate extraction against large synthetic listing pages.
+
+Serves generated pages from a local stand-in for the r.jina.ai mirror and compares
+reading the whole page then running PNG_RE.findall (the old path) with the streaming
+CandidateExtractor, with and without the early cut-off. Reports wall time,
+time-to-first-candidate and peak Python memory (tracemalloc).
+
+Usage:
+  python scripts/bench_iconscout_extract.py --page-mb 8 --hits 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from concept_catalog import iter_concepts
+from pull_iconscout_best_icons import (
+    PNG_RE,
+    CandidateExtractor,
+    MetricsLog,
+    PullOptions,
+    fetch_bytes,
+    score_url,
+)
+
+
+def build_page(size_bytes: int, hits: int, seed: int) -> bytes:
+    rng = random.Random(seed)
+    words = ["3d", "icon", "render", "gpu", "chip", "card", "ram", "module", "free", "premium", "pack"]
+    positions = sorted(rng.randrange(size_bytes) for _ in range(hits))
+    parts: list[str] = []
+    written = 0
+    for i, pos in enumerate(positions):
+        filler = " ".join(rng.choice(words) for _ in range(max(0, (pos - written) // 6)))
+        tier = "premium" if i % 3 else "free"
+        url = f"https://cdn3d.iconscout.com/3d/{tier}/thumb/{rng.choice(words)}-{rng.choice(words)}-3d-icon-png-download-{i}.png"
+        parts.append(f"{filler} ![img]({url}) ")
+        written += len(parts[-1])
+    parts.append(" ".join(rng.choice(words) for _ in range(max(0, (size_bytes - written) // 6))))
+    return "".join(parts).encode("utf-8")
+
+
+def serve(page: bytes) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(page)))
+            self.end_headers()
+            view = memoryview(page)
+            try:
+                for start in range(0, len(view), 64 * 1024):
+                    self.wfile.write(view[start : start + 64 * 1024])
+            except ConnectionError:
+                # The early cut-off closes the connection mid-page on purpose.
+                pass
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_whole_page(url: str, options: PullOptions) -> tuple[int, float | None]:
+    started = time.perf_counter()
+    text = fetch_bytes(url, {}, MetricsLog(), "mirror", options).decode("utf-8", "ignore")
+    urls = sorted(set(PNG_RE.findall(text)))
+    return len(urls), ((time.perf_counter() - started) * 1000.0 if urls else None)
+
+
+def run_streaming(url: str, options: PullOptions, stop_after: int) -> tuple[int, float | None]:
+    concept = next(iter_concepts())
+    extractor = CandidateExtractor(
+        score=lambda u: score_url(u, concept.include, concept.exclude),
+        strong_score=options.strong_score,
+        stop_after=stop_after,
+    )
+    fetch_bytes(url, {}, MetricsLog(), "mirror", options, sink=extractor)
+    return len(extractor.urls), extractor.first_candidate_ms
+
+
+def measure(label: str, fn, *args) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    count, first_ms = fn(*args)
+    total_ms = (time.perf_counter() - started) * 1000.0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    first = "-" if first_ms is None else f"{first_ms:.1f}"
+    print(f"{label:<24} {count:>6} urls  total {total_ms:>8.1f} ms  first {first:>8} ms  peak {peak / 1e6:>7.2f} MB")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--page-mb", type=float, default=8.0)
+    parser.add_argument("--hits", type=int, default=400)
+    parser.add_argument("--stop-after", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    page = build_page(int(args.page_mb * 1024 * 1024), args.hits, args.seed)
+    server = serve(page)
+    concept = next(iter_concepts())
+    url = f"http://127.0.0.1:{server.server_port}/3d-icons/{concept.queries[0]}"
+    options = PullOptions(retries=0)
+    print(f"[bench] page {len(page) / 1e6:.1f} MB, {args.hits} embedded URLs, concept {concept.out_name}")
+
+    try:
+        measure("read all + findall", run_whole_page, url, options)
+        measure("streaming", run_streaming, url, options, 0)
+        measure(f"streaming, stop@{args.stop_after}", run_streaming, url, options, args.stop_after)
+    finally:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
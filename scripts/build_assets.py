@@ -0,0 +1,455 @@
+"""
+Build the kiosk's art assets as an incremental, parallel stage graph.
+
+Stages (fetch|render -> optimize -> rasterize -> analyze -> package):
+- fetch:     pull_iconscout_best_icons.py into src/assets/icons3d (--icons-source fetch)
+- render:    one Blender task per icon into src/assets/icons3d (--icons-source render); threads per
+             task follow the host profile from render_hardware_icons_blender.py --calibrate
+- optimize:  optimize_card_svgs.py, verified optimized copies of cards-vivid in build/card-svgs
+             (the checked-in SVGs are never rewritten)
+- rasterize: rasterize_card_faces.py, per-density bitmaps of the optimized copies
+- analyze:   analyze_icon_faces.py, placeholders and bounding boxes
+- package:   index_assets.py, the content-hash asset index
+
+Each stage declares its inputs and outputs. A stage (or a single per-icon task) runs only
+when the fingerprint of its inputs, script and arguments differs from the last successful
+run recorded in .cache/build-state.json, or when an output is missing. Ready tasks run
+concurrently under one --jobs worker budget. --dry-run prints the plan with a cost
+estimate from previous durations.
+
+Usage:
+  python scripts/build_assets.py --icons-source render --blender "C:\\Program Files\\Blender Foundation\\Blender 4.1\\blender.exe"
+  python scripts/build_assets.py --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import glob
+import hashlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from concept_catalog import DEFAULT_CATALOG, concept_ids
+
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPTS_DIR)
+STATE_PATH = ".cache/build-state.json"
+PROFILE_PATH = f".cache/cycles-profile-{socket.gethostname()}.json"
+DEFAULT_BLENDER_THREADS = 4
+
+CARD_SVG_DIR = "src/assets/cards-vivid"
+OPTIMIZED_SVG_DIR = "build/card-svgs"
+
+
+@dataclass
+class Task:
+    name: str
+    argv: list[str]
+    outputs: list[str] = field(default_factory=list)
+    weight: int = 1
+
+
+@dataclass
+class Stage:
+    name: str
+    deps: list[str]
+    inputs: list[str]
+    outputs: list[str]
+    tasks: list[Task]
+
+
+class Fingerprinter:
+    """SHA-256 over files, reusing per-file hashes while size and mtime are unchanged."""
+
+    def __init__(self, cache: dict[str, list]) -> None:
+        self.cache = cache
+
+    def file_hash(self, path: str) -> str:
+        st = os.stat(path)
+        cached = self.cache.get(path)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(1024 * 1024):
+                digest.update(chunk)
+        self.cache[path] = [st.st_size, st.st_mtime_ns, digest.hexdigest()]
+        return self.cache[path][2]
+
+    def of(self, patterns: list[str], extra: list[str]) -> str:
+        digest = hashlib.sha256()
+        for part in extra:
+            digest.update(part.encode("utf-8") + b"\0")
+        for path in expand(patterns):
+            digest.update(path.encode("utf-8") + b"\0" + self.file_hash(path).encode("ascii"))
+        return digest.hexdigest()
+
+
+def expand(patterns: list[str]) -> list[str]:
+    paths: set[str] = set()
+    for pattern in patterns:
+        paths.update(p.replace(os.sep, "/") for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+    return sorted(paths)
+
+
+def outputs_exist(patterns: list[str]) -> bool:
+    return all(glob.glob(pattern) for pattern in patterns)
+
+
+def script(name: str) -> str:
+    return f"scripts/{name}"
+
+
+def renderable_ids() -> set[str]:
+    # The renderer imports bpy, so read its BUILDERS keys from the source instead.
+    with open(script("render_hardware_icons_blender.py"), "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "BUILDERS" for t in node.targets):
+            return {key.value for key in node.value.keys if isinstance(key, ast.Constant)}
+    return set()
+
+
+def render_split(args: argparse.Namespace) -> tuple[int, int]:
+    # Threads per Blender task and the budget slots it takes. The calibrated profile may
+    # recommend fewer processes than cores / threads when memory is the limit.
+    recommended = load_state(PROFILE_PATH).get("recommended", {})
+    threads = args.blender_threads or recommended.get("threads") or DEFAULT_BLENDER_THREADS
+    processes = recommended.get("processes")
+    weight = max(threads, args.jobs // processes) if processes and not args.blender_threads else threads
+    return threads, weight
+
+
+def define_stages(args: argparse.Namespace) -> list[Stage]:
+    python = sys.executable
+    catalog = os.path.relpath(args.catalog, REPO_ROOT).replace(os.sep, "/")
+    icon_ids = concept_ids(args.catalog)
+    jobs = args.jobs
+    optimized_dir = f"{OPTIMIZED_SVG_DIR}/{os.path.basename(CARD_SVG_DIR)}"
+    stages: list[Stage] = []
+
+    if args.icons_source == "fetch":
+        stages.append(
+            Stage(
+                name="fetch",
+                deps=[],
+                inputs=[script("pull_iconscout_best_icons.py"), script("concept_catalog.py"), catalog],
+                outputs=["src/assets/icons3d/iconscout-manifest.md"],
+                tasks=[Task("fetch", [python, script("pull_iconscout_best_icons.py"), "--catalog", catalog])],
+            )
+        )
+        icons_stage = "fetch"
+    else:
+        threads, weight = render_split(args)
+        supported = renderable_ids()
+        skipped = [icon_id for icon_id in icon_ids if icon_id not in supported]
+        icon_ids = [icon_id for icon_id in icon_ids if icon_id in supported]
+        if skipped:
+            shown = ", ".join(skipped[:10]) + (f", ... (+{len(skipped) - 10})" if len(skipped) > 10 else "")
+            print(f"[render] skipping {len(skipped)} catalog ids without a Blender builder: {shown}")
+        stages.append(
+            Stage(
+                name="render",
+                deps=[],
+                inputs=[script("render_hardware_icons_blender.py"), PROFILE_PATH],
+                outputs=[f"src/assets/icons3d/{icon_id}.png" for icon_id in icon_ids],
+                tasks=[
+                    Task(
+                        icon_id,
+                        [
+                            args.blender or "blender",
+                            "--background",
+                            "--threads",
+                            str(threads),
+                            "--python-exit-code",
+                            "1",
+                            "--python",
+                            script("render_hardware_icons_blender.py"),
+                            "--",
+                            "--output-dir",
+                            "src/assets/icons3d",
+                            "--only",
+                            icon_id,
+                            "--threads",
+                            str(threads),
+                        ],
+                        outputs=[f"src/assets/icons3d/{icon_id}.png"],
+                        weight=weight,
+                    )
+                    for icon_id in icon_ids
+                ],
+            )
+        )
+        icons_stage = "render"
+
+    stages += [
+        Stage(
+            name="optimize",
+            deps=[],
+            inputs=[script("optimize_card_svgs.py"), f"{CARD_SVG_DIR}/*.svg"],
+            outputs=[f"{optimized_dir}/*.svg"],
+            tasks=[
+                Task(
+                    "optimize",
+                    [python, script("optimize_card_svgs.py"), CARD_SVG_DIR, "--output-dir", OPTIMIZED_SVG_DIR, "--jobs", str(jobs)],
+                    weight=jobs,
+                )
+            ],
+        ),
+        Stage(
+            name="rasterize",
+            deps=["optimize"],
+            inputs=[script("rasterize_card_faces.py"), f"{optimized_dir}/*.svg"],
+            outputs=["src/assets/cards-raster/manifest.json"],
+            tasks=[
+                Task(
+                    "rasterize",
+                    [python, script("rasterize_card_faces.py"), "--input-dir", optimized_dir, "--jobs", str(jobs)],
+                    weight=jobs,
+                )
+            ],
+        ),
+        Stage(
+            name="analyze",
+            deps=[icons_stage, "rasterize"],
+            inputs=[script("analyze_icon_faces.py"), catalog, "src/assets/icons3d/*.png", "src/assets/cards-raster/*@1x.png"],
+            outputs=["src/assets/iconPlaceholders.json"],
+            tasks=[Task("analyze", [python, script("analyze_icon_faces.py"), "--catalog", catalog])],
+        ),
+        Stage(
+            name="package",
+            deps=["analyze"],
+            inputs=[script("index_assets.py"), "src/assets/**/*"],
+            outputs=["src/assets/asset-index.json"],
+            tasks=[Task("package", [python, script("index_assets.py")])],
+        ),
+    ]
+    return stages
+
+
+def task_fingerprint(stage_fp: str, task: Task) -> str:
+    return hashlib.sha256(f"{stage_fp}\0{task.name}\0{' '.join(task.argv)}".encode("utf-8")).hexdigest()
+
+
+def stale_tasks(stage: Stage, stage_fp: str, state: dict) -> list[Task]:
+    recorded = state.get("stages", {}).get(stage.name, {})
+    if recorded.get("fingerprint") == stage_fp and outputs_exist(stage.outputs):
+        return []
+    done = recorded.get("tasks", {})
+    return [
+        task
+        for task in stage.tasks
+        if done.get(task.name, {}).get("fingerprint") != task_fingerprint(stage_fp, task) or not outputs_exist(task.outputs)
+    ]
+
+
+def stage_inputs_fingerprint(stage: Stage, fingerprinter: Fingerprinter) -> str:
+    # The package stage's glob covers its own output; leave it out so it can settle.
+    patterns = stage.inputs
+    skip = set(expand(stage.outputs)) if stage.name == "package" else set()
+    extra = [stage.name, *(" ".join(t.argv) for t in stage.tasks)]
+    if not skip:
+        return fingerprinter.of(patterns, extra)
+    digest = hashlib.sha256("\0".join(extra).encode("utf-8"))
+    for path in expand(patterns):
+        if path not in skip:
+            digest.update(path.encode("utf-8") + b"\0" + fingerprinter.file_hash(path).encode("ascii"))
+    return digest.hexdigest()
+
+
+def estimate_seconds(stage: Stage, tasks: list[Task], state: dict, budget: int) -> float | None:
+    recorded = state.get("stages", {}).get(stage.name, {}).get("tasks", {})
+    durations = [recorded.get(t.name, {}).get("duration_s") for t in tasks]
+    if not tasks:
+        return 0.0
+    if any(d is None for d in durations):
+        return None
+    lanes = max(1, min(len(tasks), budget // max(1, tasks[0].weight)))
+    return sum(durations) / lanes
+
+
+def load_state(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(path: str, state: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def print_plan(stages: list[Stage], state: dict, fingerprinter: Fingerprinter, budget: int) -> None:
+    dirty: set[str] = set()
+    total = 0.0
+    unknown = False
+    for stage in stages:
+        if any(dep in dirty for dep in stage.deps):
+            tasks, reason = stage.tasks, "upstream changes"
+        else:
+            tasks = stale_tasks(stage, stage_inputs_fingerprint(stage, fingerprinter), state)
+            reason = "inputs changed" if tasks else "up to date"
+        if tasks:
+            dirty.add(stage.name)
+        estimate = estimate_seconds(stage, tasks, state, budget)
+        if estimate is None:
+            unknown = True
+            cost = "unknown (no previous run)"
+        else:
+            total += estimate
+            cost = f"~{estimate:.1f}s"
+        deps = f" after {', '.join(stage.deps)}" if stage.deps else ""
+        print(f"[plan] {stage.name:<10} {len(tasks):>3}/{len(stage.tasks)} tasks  {cost:<26} {reason}{deps}")
+    print(f"[plan] estimated serial-stage total: ~{total:.1f}s{' + unknown stages' if unknown else ''} with {budget} workers")
+
+
+def run_task(task: Task, verbose: bool) -> float:
+    started = time.perf_counter()
+    result = subprocess.run(task.argv, cwd=REPO_ROOT, capture_output=not verbose, text=True)
+    duration = time.perf_counter() - started
+    if result.returncode != 0:
+        detail = "" if verbose else (result.stdout + result.stderr).strip()[-2000:]
+        raise RuntimeError(f"exit {result.returncode}\n{detail}".rstrip())
+    return duration
+
+
+def build(stages: list[Stage], state: dict, fingerprinter: Fingerprinter, args: argparse.Namespace) -> int:
+    by_name = {stage.name: stage for stage in stages}
+    stage_state = state.setdefault("stages", {})
+    # Tasks wait here, not in pool threads; one is submitted once its worker slots are free.
+    free_slots = args.jobs
+    queued: list[tuple[Stage, Task]] = []
+
+    finished: set[str] = set()
+    failed: set[str] = set()
+    started: set[str] = set()
+    remaining: dict[str, int] = {}
+    fingerprints: dict[str, str] = {}
+    running: dict[Future, tuple[Stage, Task]] = {}
+
+    def slots(task: Task) -> int:
+        return max(1, min(task.weight, args.jobs))
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        while True:
+            progressed = True
+            while progressed:
+                progressed = False
+                for stage in stages:
+                    if stage.name in started or not all(d in finished or d in failed for d in stage.deps):
+                        continue
+                    started.add(stage.name)
+                    progressed = True
+                    if any(d in failed for d in stage.deps):
+                        failed.add(stage.name)
+                        print(f"[skip] {stage.name}: upstream failed")
+                        continue
+                    fp = fingerprints[stage.name] = stage_inputs_fingerprint(stage, fingerprinter)
+                    tasks = stale_tasks(stage, fp, state)
+                    if not tasks:
+                        finished.add(stage.name)
+                        print(f"[fresh] {stage.name}")
+                        continue
+                    print(f"[stage] {stage.name}: {len(tasks)}/{len(stage.tasks)} tasks")
+                    remaining[stage.name] = len(tasks)
+                    stage_state.setdefault(stage.name, {}).pop("fingerprint", None)
+                    queued.extend((stage, task) for task in tasks)
+
+            for item in list(queued):
+                stage, task = item
+                if slots(task) <= free_slots:
+                    queued.remove(item)
+                    free_slots -= slots(task)
+                    running[pool.submit(run_task, task, args.verbose)] = (stage, task)
+
+            if not running:
+                break
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, task = running.pop(future)
+                free_slots += slots(task)
+                record = stage_state.setdefault(stage.name, {}).setdefault("tasks", {})
+                try:
+                    duration = future.result()
+                except Exception as e:
+                    failed.add(stage.name)
+                    print(f"[fail] {stage.name}/{task.name}: {e}")
+                else:
+                    print(f"[done] {stage.name}/{task.name} in {duration:.1f}s")
+                    record[task.name] = {
+                        "fingerprint": task_fingerprint(fingerprints[stage.name], task),
+                        "duration_s": round(duration, 3),
+                    }
+                remaining[stage.name] -= 1
+                if remaining[stage.name] == 0 and stage.name not in failed:
+                    finished.add(stage.name)
+                    stage_state[stage.name]["fingerprint"] = fingerprints[stage.name]
+                save_state(args.state, state)
+
+    save_state(args.state, state)
+    unknown = set(by_name) - finished - failed
+    if failed or unknown:
+        print(f"[build] failed: {', '.join(sorted(failed | unknown))}")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--icons-source", choices=("fetch", "render"), default="fetch")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER"), help="Blender executable for --icons-source render")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Global worker budget")
+    parser.add_argument(
+        "--blender-threads",
+        type=int,
+        default=0,
+        help=f"Cycles threads (and budget slots) per render task (default: host profile, else {DEFAULT_BLENDER_THREADS})",
+    )
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG)
+    parser.add_argument("--state", default=STATE_PATH)
+    parser.add_argument("--only", default="", help="Comma-separated stages to consider (default: all)")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--verbose", action="store_true", help="Stream stage output instead of capturing it")
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)
+    started = time.perf_counter()
+    if args.icons_source == "render" and not args.blender and not args.dry_run:
+        print("[error] --blender (or $BLENDER) is required for --icons-source render")
+        return 2
+
+    stages = define_stages(args)
+    if args.only:
+        wanted = {name.strip() for name in args.only.split(",")}
+        stages = [s for s in stages if s.name in wanted]
+        for stage in stages:
+            stage.deps = [d for d in stage.deps if d in wanted]
+
+    state = load_state(args.state)
+    fingerprinter = Fingerprinter(state.setdefault("files", {}))
+    if args.dry_run:
+        print_plan(stages, state, fingerprinter, args.jobs)
+        save_state(args.state, state)
+        return 0
+
+    rc = build(stages, state, fingerprinter, args)
+    print(f"[build] {'ok' if rc == 0 else 'failed'} in {time.perf_counter() - started:.2f}s")
+    return rc
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
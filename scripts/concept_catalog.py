@@ -0,0 +1,109 @@
+"""
+Load hardware concepts from an external catalog.
+
+Catalog formats, picked by extension:
+- .jsonl: one concept object per line; streamed, so memory does not grow with the catalog.
+- .json:  an array of concept objects.
+- .toml:  [[concept]] tables.
+
+Each concept is {"id": str, "queries": [str, ...], "include": [str, ...], "exclude": [str, ...]};
+unknown keys, wrong types and duplicate ids are rejected with the offending line/index.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterator
+
+
+DEFAULT_CATALOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hardware_concepts.jsonl")
+
+ID_RE = re.compile(r"^[a-z0-9][a-z0-9-]*$")
+LIST_FIELDS = ("queries", "include", "exclude")
+
+
+class CatalogError(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class Concept:
+    out_name: str
+    queries: tuple[str, ...]
+    include: tuple[str, ...]
+    exclude: tuple[str, ...]
+
+
+def parse_concept(raw: object, where: str) -> Concept:
+    if not isinstance(raw, dict):
+        raise CatalogError(f"{where}: expected an object, got {type(raw).__name__}")
+    unknown = set(raw) - {"id", *LIST_FIELDS}
+    if unknown:
+        raise CatalogError(f"{where}: unknown keys {sorted(unknown)}")
+
+    concept_id = raw.get("id")
+    if not isinstance(concept_id, str) or not ID_RE.match(concept_id):
+        raise CatalogError(f"{where}: 'id' must be a lowercase kebab-case string")
+
+    values: dict[str, tuple[str, ...]] = {}
+    for name in LIST_FIELDS:
+        value = raw.get(name, [])
+        if not isinstance(value, list) or not all(isinstance(v, str) and v for v in value):
+            raise CatalogError(f"{where}: '{name}' must be a list of non-empty strings")
+        values[name] = tuple(value)
+    if not values["queries"]:
+        raise CatalogError(f"{where}: 'queries' must not be empty")
+
+    return Concept(concept_id, values["queries"], values["include"], values["exclude"])
+
+
+def _raw_entries(path: str) -> Iterator[tuple[object, str]]:
+    if path.endswith(".jsonl"):
+        with open(path, "r", encoding="utf-8") as f:
+            for lineno, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    raw = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise CatalogError(f"{path}:{lineno}: {e.msg}") from e
+                yield raw, f"{path}:{lineno}"
+    elif path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise CatalogError(f"{path}: expected a JSON array of concepts")
+        for index, raw in enumerate(data):
+            yield raw, f"{path}[{index}]"
+    elif path.endswith(".toml"):
+        # tomllib is Python 3.11+; only TOML catalogs need it.
+        import tomllib
+
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+        for index, raw in enumerate(data.get("concept", [])):
+            yield raw, f"{path}:concept[{index}]"
+    else:
+        raise CatalogError(f"{path}: unsupported catalog format (use .jsonl, .json or .toml)")
+
+
+def iter_concepts(path: str = DEFAULT_CATALOG) -> Iterator[Concept]:
+    seen: set[str] = set()
+    for raw, where in _raw_entries(path):
+        concept = parse_concept(raw, where)
+        if concept.out_name in seen:
+            raise CatalogError(f"{where}: duplicate id {concept.out_name!r}")
+        seen.add(concept.out_name)
+        yield concept
+
+
+def concept_ids(path: str = DEFAULT_CATALOG) -> list[str]:
+    return [concept.out_name for concept in iter_concepts(path)]
+
+
+def count_queries(path: str = DEFAULT_CATALOG) -> Counter[str]:
+    return Counter(query for concept in iter_concepts(path) for query in dict.fromkeys(concept.queries))
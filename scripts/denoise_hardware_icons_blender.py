@@ -0,0 +1,186 @@
+"""
+Batch-denoise noisy icon renders into alpha PNGs with OpenImageDenoise.
+
+Consumes the multilayer EXRs written by render_hardware_icons_blender.py --denoise deferred
+(noisy beauty + Denoising Albedo/Normal passes) and runs them through the compositor's
+Denoise node, so denoising can be re-tuned without re-rendering.
+
+Usage (single Blender process):
+  "C:\\Program Files\\Blender Foundation\\Blender 4.1\\blender.exe" --background --python scripts/denoise_hardware_icons_blender.py -- --input-dir src/assets/icons3d/_noisy --output-dir src/assets/icons3d
+
+Usage (fan out over several Blender processes, run with a regular Python):
+  python scripts/denoise_hardware_icons_blender.py --blender "C:\\Program Files\\Blender Foundation\\Blender 4.1\\blender.exe" --jobs 4 --input-dir src/assets/icons3d/_noisy --output-dir src/assets/icons3d
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+
+def parse_args() -> argparse.Namespace:
+    argv = sys.argv[1:]
+    if bpy is not None:
+        argv = argv[argv.index("--") + 1 :] if "--" in argv else []
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input-dir", default="src/assets/icons3d/_noisy")
+    parser.add_argument("--output-dir", default="src/assets/icons3d")
+    parser.add_argument("--only", default="", help="Comma-separated icon ids (default: every EXR in --input-dir)")
+    parser.add_argument("--prefilter", choices=("ACCURATE", "FAST", "NONE"), default="ACCURATE")
+    parser.add_argument("--no-hdr", action="store_true", help="Disable the denoiser's HDR mode")
+    parser.add_argument("--blender", default=None, help="Blender executable used to spawn workers")
+    parser.add_argument("--jobs", type=int, default=max(1, (os.cpu_count() or 1) // 4))
+    return parser.parse_args(argv)
+
+
+def list_icon_ids(input_dir: str, only: str) -> list[str]:
+    available = sorted(name[:-4] for name in os.listdir(input_dir) if name.endswith(".exr"))
+    if not only:
+        return available
+    wanted = [icon_id.strip() for icon_id in only.split(",") if icon_id.strip()]
+    missing = [icon_id for icon_id in wanted if icon_id not in available]
+    if missing:
+        raise SystemExit(f"[denoise] missing EXR for: {', '.join(missing)}")
+    return wanted
+
+
+def prepare_scene(prefilter: str, use_hdr: bool) -> tuple[bpy.types.Scene, bpy.types.Node]:
+    bpy.ops.object.select_all(action="SELECT")
+    bpy.ops.object.delete(use_global=False)
+
+    scene = bpy.context.scene
+    # The scene itself renders nothing; only the compositor output is written.
+    scene.render.engine = "BLENDER_WORKBENCH"
+    scene.render.film_transparent = True
+    scene.render.use_compositing = True
+    scene.render.use_sequencer = False
+    scene.render.resolution_percentage = 100
+    scene.render.image_settings.file_format = "PNG"
+    scene.render.image_settings.color_mode = "RGBA"
+
+    scene.use_nodes = True
+    tree = scene.node_tree
+    tree.nodes.clear()
+    source = tree.nodes.new("CompositorNodeImage")
+    denoise = tree.nodes.new("CompositorNodeDenoise")
+    denoise.prefilter = prefilter
+    denoise.use_hdr = use_hdr
+    set_alpha = tree.nodes.new("CompositorNodeSetAlpha")
+    set_alpha.mode = "REPLACE_ALPHA"
+    composite = tree.nodes.new("CompositorNodeComposite")
+    tree.links.new(denoise.outputs["Image"], set_alpha.inputs["Image"])
+    tree.links.new(set_alpha.outputs["Image"], composite.inputs["Image"])
+    return scene, source
+
+
+def denoise_icon(scene: bpy.types.Scene, source: bpy.types.Node, exr_path: str, out_path: str) -> None:
+    image = bpy.data.images.load(exr_path, check_existing=False)
+    source.image = image
+    # Pass sockets only appear once the multilayer image is assigned.
+    tree = scene.node_tree
+    denoise = tree.nodes["Denoise"]
+    set_alpha = tree.nodes["Set Alpha"]
+    tree.links.new(source.outputs["Image"], denoise.inputs["Image"])
+    tree.links.new(source.outputs["Denoising Normal"], denoise.inputs["Normal"])
+    tree.links.new(source.outputs["Denoising Albedo"], denoise.inputs["Albedo"])
+    tree.links.new(source.outputs["Alpha"], set_alpha.inputs["Alpha"])
+
+    scene.render.resolution_x, scene.render.resolution_y = image.size
+    scene.render.filepath = out_path
+    bpy.ops.render.render(write_still=True)
+
+    source.image = None
+    bpy.data.images.remove(image)
+
+
+def write_readme(output_dir: str, icon_ids: list[str]) -> None:
+    readme_path = os.path.join(output_dir, "README.md")
+    with open(readme_path, "w", encoding="utf-8") as f:
+        f.write("# Photoreal 3D Hardware Icon Renders (Alpha PNG)\n\n")
+        f.write("Generated with Blender using transparent film and consistent cinematic lighting.\n\n")
+        f.write("Files:\n")
+        for icon_id in icon_ids:
+            f.write(f"- {icon_id}.png\n")
+
+
+def run_worker(args: argparse.Namespace) -> None:
+    input_dir = os.path.abspath(args.input_dir)
+    output_dir = os.path.abspath(args.output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    scene, source = prepare_scene(args.prefilter, not args.no_hdr)
+    icon_ids = list_icon_ids(input_dir, args.only)
+    for icon_id in icon_ids:
+        exr_path = os.path.join(input_dir, f"{icon_id}.exr")
+        out_path = os.path.join(output_dir, f"{icon_id}.png")
+        print(f"[denoise] {icon_id} -> {out_path}")
+        denoise_icon(scene, source, exr_path, out_path)
+    if not args.only:
+        write_readme(output_dir, icon_ids)
+
+
+def run_pool(args: argparse.Namespace) -> int:
+    if not args.blender:
+        print("[denoise] --blender is required when not running inside Blender", file=sys.stderr)
+        return 2
+
+    icon_ids = list_icon_ids(os.path.abspath(args.input_dir), args.only)
+    jobs = max(1, min(args.jobs, len(icon_ids)))
+    threads = max(1, (os.cpu_count() or 1) // jobs)
+    shards = [icon_ids[i::jobs] for i in range(jobs)]
+
+    procs = []
+    for shard in shards:
+        cmd = [
+            args.blender,
+            "--background",
+            "--factory-startup",
+            "--threads",
+            str(threads),
+            "--python-exit-code",
+            "1",
+            "--python",
+            os.path.abspath(__file__),
+            "--",
+            "--input-dir",
+            args.input_dir,
+            "--output-dir",
+            args.output_dir,
+            "--only",
+            ",".join(shard),
+            "--prefilter",
+            args.prefilter,
+        ]
+        if args.no_hdr:
+            cmd.append("--no-hdr")
+        print(f"[denoise] worker: {len(shard)} icons, {threads} threads")
+        procs.append(subprocess.Popen(cmd))
+
+    failed = [proc.args for proc in procs if proc.wait() != 0]
+    if failed:
+        print(f"[warn] {len(failed)} denoise worker(s) failed", file=sys.stderr)
+        return 1
+    if not args.only:
+        # Workers are always sharded with --only, so the README is written once here.
+        write_readme(os.path.abspath(args.output_dir), icon_ids)
+    return 0
+
+
+def main() -> int:
+    args = parse_args()
+    if bpy is None:
+        return run_pool(args)
+    run_worker(args)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
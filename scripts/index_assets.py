@@ -0,0 +1,189 @@
+"""
+Build a content-hash index of src/assets and report duplicated files.
+
+This script:
+1) Walks src/assets and hashes every file in chunks (SHA-256).
+2) Reuses hashes from .cache/asset-index-cache.json when size and mtime are unchanged.
+3) Groups byte-identical files, and SVGs that are identical after normalization.
+4) Picks one canonical file per group, preferring files the app actually imports.
+5) Writes a JSON index mapping every logical id (path under src/assets, no extension)
+   to its canonical file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+import xml.etree.ElementTree as ET
+
+from optimize_card_svgs import optimize_svg
+
+
+ASSETS_DIR = "src/assets"
+SOURCE_DIR = "src"
+CACHE_PATH = ".cache/asset-index-cache.json"
+CHUNK_SIZE = 1024 * 1024
+
+IMPORT_RE = re.compile(r"""['"]@/assets/([^'"]+)['"]""")
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def normalized_svg_hash(path: str) -> str | None:
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        # Minify first so formatting, comments and precision noise do not matter, then
+        # canonicalize so attribute order does not either.
+        canonical = ET.canonicalize(optimize_svg(data, precision=1).decode("utf-8"), strip_text=True)
+    except (ET.ParseError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def load_cache(path: str) -> dict[str, dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(path: str, cache: dict[str, dict]) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def walk_assets(assets_dir: str, skip: set[str]) -> list[str]:
+    paths: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(assets_dir):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name).replace(os.sep, "/")
+            if path not in skip:
+                paths.append(path)
+    return paths
+
+
+def imported_assets(source_dir: str) -> set[str]:
+    imported: set[str] = set()
+    for dirpath, _, filenames in os.walk(source_dir):
+        for name in filenames:
+            if not name.endswith((".ts", ".tsx", ".css")):
+                continue
+            with open(os.path.join(dirpath, name), "r", encoding="utf-8", errors="ignore") as f:
+                imported.update(f"{ASSETS_DIR}/{m}" for m in IMPORT_RE.findall(f.read()))
+    return imported
+
+
+def index_files(paths: list[str], cache: dict[str, dict]) -> tuple[dict[str, dict], int]:
+    entries: dict[str, dict] = {}
+    hashed = 0
+    for path in paths:
+        st = os.stat(path)
+        cached = cache.get(path)
+        if cached and cached["size"] == st.st_size and cached["mtime_ns"] == st.st_mtime_ns:
+            entries[path] = cached
+            continue
+        entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": hash_file(path)}
+        if path.endswith(".svg"):
+            entry["svg_sha256"] = normalized_svg_hash(path)
+        entries[path] = entry
+        hashed += 1
+    return entries, hashed
+
+
+def group_by(entries: dict[str, dict], key: str) -> list[list[str]]:
+    groups: dict[str, list[str]] = {}
+    for path, entry in entries.items():
+        value = entry.get(key)
+        if value:
+            groups.setdefault(value, []).append(path)
+    return [paths for paths in groups.values() if len(paths) > 1]
+
+
+def pick_canonical(paths: list[str], imported: set[str]) -> str:
+    return min(paths, key=lambda p: (p not in imported, len(p), p))
+
+
+def logical_id(path: str, assets_dir: str) -> str:
+    return os.path.splitext(os.path.relpath(path, assets_dir).replace(os.sep, "/"))[0]
+
+
+def build_index(entries: dict[str, dict], imported: set[str], assets_dir: str) -> dict:
+    canonical = {path: path for path in entries}
+    exact = group_by(entries, "sha256")
+    near = [g for g in group_by(entries, "svg_sha256") if len({entries[p]["sha256"] for p in g}) > 1]
+
+    duplicates = []
+    for kind, groups in (("exact", exact), ("normalized-svg", near)):
+        for paths in groups:
+            target = pick_canonical(paths, imported)
+            for path in paths:
+                # An exact match already resolved by an earlier group keeps its target.
+                if canonical[path] == path:
+                    canonical[path] = target
+            copies = sorted(p for p in paths if p != target)
+            duplicates.append(
+                {
+                    "kind": kind,
+                    "canonical": target,
+                    "copies": copies,
+                    "wastedBytes": sum(entries[p]["size"] for p in copies),
+                }
+            )
+
+    return {
+        "version": 1,
+        "ids": {logical_id(path, assets_dir): canonical[path] for path in entries},
+        "files": {
+            path: {"sha256": entry["sha256"], "size": entry["size"], "imported": path in imported}
+            for path, entry in entries.items()
+        },
+        "duplicates": duplicates,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--assets-dir", default=ASSETS_DIR)
+    parser.add_argument("--output", default=f"{ASSETS_DIR}/asset-index.json")
+    parser.add_argument("--cache", default=CACHE_PATH)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    cache = load_cache(args.cache)
+    paths = walk_assets(args.assets_dir, skip={args.output.replace(os.sep, "/")})
+    entries, hashed = index_files(paths, cache)
+    if hashed or len(entries) != len(cache):
+        save_cache(args.cache, entries)
+
+    index = build_index(entries, imported_assets(SOURCE_DIR), args.assets_dir)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+        f.write("\n")
+
+    wasted = sum(group["wastedBytes"] for group in index["duplicates"])
+    elapsed = time.perf_counter() - started
+    print(f"[index] {len(entries)} files, {hashed} hashed, {len(entries) - hashed} cached in {elapsed:.3f}s")
+    for group in index["duplicates"]:
+        print(f"[dup:{group['kind']}] {group['canonical']} <- {', '.join(group['copies'])}")
+    print(f"[index] {len(index['duplicates'])} duplicate groups, {wasted} redundant bytes -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
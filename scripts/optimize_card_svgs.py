@@ -0,0 +1,543 @@
+"""
+Minify the hand-authored card SVGs in parallel.
+
+This script:
+1) Streams each SVG through an XML pull parser, dropping comments and editor metadata.
+2) Rounds coordinates/path data to --precision decimals (more for small viewBoxes) and
+   collapses transforms and groups.
+3) Merges identical gradients and drops unreferenced gradients, patterns, masks and similar
+   <defs> entries; <style> and <script> are always kept.
+4) Rasterizes the original and optimized file and rejects results outside --tolerance.
+5) Reports bytes and element counts before/after; rewrites files unless --dry-run, or
+   with --output-dir writes a complete optimized copy of each directory there and leaves
+   the sources alone (rejected files are copied unchanged).
+
+Raster verification needs cairosvg and Pillow. Without them nothing is written unless
+--no-verify is passed explicitly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import math
+import os
+import re
+import shutil
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+try:
+    import cairosvg
+    from PIL import Image, ImageChops
+except ImportError:
+    cairosvg = None
+
+
+DEFAULT_DIRS = [
+    "src/assets/cards",
+    "src/assets/cards-renamed",
+    "src/assets/cards-vivid",
+]
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+EDITOR_NAMESPACES = {
+    "http://www.inkscape.org/namespaces/inkscape",
+    "http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd",
+    "http://www.bohemiancoding.com/sketch/ns",
+    "http://ns.adobe.com/AdobeIllustrator/10.0/",
+    "http://ns.adobe.com/Extensibility/1.0/",
+    "http://purl.org/dc/elements/1.1/",
+    "http://creativecommons.org/ns#",
+    "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+}
+
+NUMERIC_ATTRS = {
+    "x", "y", "x1", "y1", "x2", "y2", "cx", "cy", "r", "rx", "ry", "fx", "fy", "fr",
+    "width", "height", "offset", "opacity", "fill-opacity", "stroke-opacity", "stop-opacity",
+    "stroke-width", "stroke-miterlimit", "stroke-dashoffset", "stroke-dasharray",
+    "font-size", "letter-spacing", "d", "points",
+}
+TRANSFORM_ATTRS = {"transform", "gradientTransform", "patternTransform"}
+
+# Coordinates that a pure translation can be folded into, per element.
+TRANSLATE_TARGETS = {
+    "rect": ("x", "y"),
+    "image": ("x", "y"),
+    "use": ("x", "y"),
+    "text": ("x", "y"),
+    "circle": ("cx", "cy"),
+    "ellipse": ("cx", "cy"),
+}
+
+# Group attributes that may be pushed onto a single child without changing rendering.
+MOVABLE_GROUP_ATTRS = {
+    "transform", "fill", "fill-opacity", "fill-rule", "stroke", "stroke-width", "stroke-opacity",
+    "stroke-linecap", "stroke-linejoin", "stroke-miterlimit", "stroke-dasharray",
+    "stroke-dashoffset", "opacity", "font-family", "font-size", "font-weight", "text-anchor",
+    "letter-spacing",
+}
+
+GRADIENT_TAGS = {"linearGradient", "radialGradient"}
+
+# Definitions that only render through an id reference; anything else in <defs> is kept.
+PRUNABLE_DEF_TAGS = GRADIENT_TAGS | {"pattern", "clipPath", "mask", "filter", "symbol", "marker"}
+
+# Largest raster the cards are drawn at (256 CSS px at 3x, rounded up); coordinate rounding
+# must stay well below one pixel at this size whatever the viewBox scale.
+MAX_RENDER_PX = 1024
+MAX_ROUNDING_PX = 0.1
+
+NUMBER_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+TRANSFORM_RE = re.compile(r"(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)")
+URL_REF_RE = re.compile(r"url\(\s*['\"]?#([^)'\"\s]+)['\"]?\s*\)")
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+RESERVED_NAMESPACES = EDITOR_NAMESPACES | {SVG_NS, XLINK_NS}
+RESERVED_PREFIXES = {"", "xlink"}
+
+ET.register_namespace("", SVG_NS)
+ET.register_namespace("xlink", XLINK_NS)
+
+
+@dataclass
+class SvgResult:
+    path: str
+    bytes_before: int
+    bytes_after: int
+    elements_before: int
+    elements_after: int
+    max_diff: int | None
+    data: bytes | None = None
+    error: str | None = None
+
+
+def local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def namespace_of(name: str) -> str:
+    return name[1:].split("}", 1)[0] if name.startswith("{") else ""
+
+
+def format_number(value: float, precision: int) -> str:
+    text = f"{round(value, precision):.{precision}f}"
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    if text in ("-0", ""):
+        return "0"
+    if text.startswith("0."):
+        return text[1:]
+    if text.startswith("-0."):
+        return "-" + text[2:]
+    return text
+
+
+def round_numbers(value: str, precision: int) -> str:
+    parts: list[str] = []
+    last = 0
+    previous = ""
+    for match in NUMBER_RE.finditer(value):
+        text = format_number(float(match.group(0)), precision)
+        between = value[last : match.start()]
+        # Numbers written back to back ("1.0.5") must not run together once rounded ("1.5").
+        if not between and previous and (text[0].isdigit() or (text[0] == "." and "." not in previous)):
+            between = " "
+        parts.append(between + text)
+        previous = text
+        last = match.end()
+    parts.append(value[last:])
+    return "".join(parts)
+
+
+def parse_transform(value: str) -> tuple[float, ...] | None:
+    matrix = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+    consumed = TRANSFORM_RE.sub("", value).replace(",", " ").strip()
+    if consumed:
+        return None
+    for name, raw_args in TRANSFORM_RE.findall(value):
+        args = [float(a) for a in NUMBER_RE.findall(raw_args)]
+        if name == "matrix" and len(args) == 6:
+            step = tuple(args)
+        elif name == "translate" and len(args) in (1, 2):
+            step = (1.0, 0.0, 0.0, 1.0, args[0], args[1] if len(args) == 2 else 0.0)
+        elif name == "scale" and len(args) in (1, 2):
+            step = (args[0], 0.0, 0.0, args[1] if len(args) == 2 else args[0], 0.0, 0.0)
+        elif name == "rotate" and len(args) in (1, 3):
+            rad = math.radians(args[0])
+            cos, sin = math.cos(rad), math.sin(rad)
+            cx, cy = (args[1], args[2]) if len(args) == 3 else (0.0, 0.0)
+            step = (cos, sin, -sin, cos, cx - cos * cx + sin * cy, cy - sin * cx - cos * cy)
+        elif name == "skewX" and len(args) == 1:
+            step = (1.0, 0.0, math.tan(math.radians(args[0])), 1.0, 0.0, 0.0)
+        elif name == "skewY" and len(args) == 1:
+            step = (1.0, math.tan(math.radians(args[0])), 0.0, 1.0, 0.0, 0.0)
+        else:
+            return None
+        a, b, c, d, e, f = matrix
+        a2, b2, c2, d2, e2, f2 = step
+        matrix = (
+            a * a2 + c * b2,
+            b * a2 + d * b2,
+            a * c2 + c * d2,
+            b * c2 + d * d2,
+            a * e2 + c * f2 + e,
+            b * e2 + d * f2 + f,
+        )
+    return matrix
+
+
+def is_translation(matrix: tuple[float, ...]) -> bool:
+    a, b, c, d, _, _ = matrix
+    return math.isclose(a, 1.0, abs_tol=1e-9) and abs(b) < 1e-9 and abs(c) < 1e-9 and math.isclose(d, 1.0, abs_tol=1e-9)
+
+
+def format_transform(matrix: tuple[float, ...], precision: int) -> str:
+    a, b, c, d, e, f = matrix
+    if is_translation(matrix):
+        if abs(round(e, precision)) == 0 and abs(round(f, precision)) == 0:
+            return ""
+        if abs(round(f, precision)) == 0:
+            return f"translate({format_number(e, precision)})"
+        return f"translate({format_number(e, precision)} {format_number(f, precision)})"
+    # The linear part needs more digits than coordinates to keep rotations exact.
+    linear = " ".join(format_number(v, precision + 3) for v in (a, b, c, d))
+    return f"matrix({linear} {format_number(e, precision)} {format_number(f, precision)})"
+
+
+def parse_svg(data: bytes) -> ET.Element:
+    # XMLPullParser lets the file be fed in chunks; comments are never added to the tree.
+    parser = ET.XMLPullParser(events=("start-ns", "start"))
+    root: ET.Element | None = None
+    view = memoryview(data)
+    for start in range(0, len(view), 64 * 1024):
+        parser.feed(bytes(view[start : start + 64 * 1024]))
+        for event, payload in parser.read_events():
+            if event == "start-ns" and payload[1] not in RESERVED_NAMESPACES and payload[0] not in RESERVED_PREFIXES:
+                # The registry is process-wide; the SVG/xlink prefixes stay fixed whatever
+                # a document (e.g. Inkscape's xmlns:svg) declares.
+                ET.register_namespace(*payload)
+            elif event == "start" and root is None:
+                root = payload
+    parser.close()
+    if root is None:
+        raise ValueError("no root element")
+    return root
+
+
+def parent_map(root: ET.Element) -> dict[ET.Element, ET.Element]:
+    return {child: parent for parent in root.iter() for child in parent}
+
+
+def strip_editor_data(root: ET.Element) -> None:
+    for parent in list(root.iter()):
+        for child in list(parent):
+            if not isinstance(child.tag, str) or namespace_of(child.tag) in EDITOR_NAMESPACES or local_name(child.tag) == "metadata":
+                parent.remove(child)
+    for el in root.iter():
+        for name in [n for n in el.attrib if namespace_of(n) in EDITOR_NAMESPACES]:
+            del el.attrib[name]
+
+
+def round_attributes(root: ET.Element, precision: int) -> None:
+    for el in root.iter():
+        for name, value in el.attrib.items():
+            if name in NUMERIC_ATTRS:
+                el.set(name, round_numbers(value, precision))
+            elif name in TRANSFORM_ATTRS:
+                matrix = parse_transform(value)
+                rounded = round_numbers(value, precision)
+                if matrix is not None:
+                    collapsed = format_transform(matrix, precision)
+                    if len(collapsed) < len(rounded):
+                        rounded = collapsed
+                if rounded:
+                    el.set(name, rounded)
+                else:
+                    del el.attrib[name]
+
+
+def referenced_ids(root: ET.Element) -> set[str]:
+    refs: set[str] = set()
+    for el in root.iter():
+        for name, value in el.attrib.items():
+            refs.update(URL_REF_RE.findall(value))
+            if local_name(name) == "href" and value.startswith("#"):
+                refs.add(value[1:])
+        if local_name(el.tag) == "style" and el.text:
+            refs.update(URL_REF_RE.findall(el.text))
+    return refs
+
+
+def rewrite_references(root: ET.Element, renames: dict[str, str]) -> None:
+    def swap(match: re.Match[str]) -> str:
+        return f"url(#{renames.get(match.group(1), match.group(1))})"
+
+    for el in root.iter():
+        for name, value in el.attrib.items():
+            if local_name(name) == "href" and value.startswith("#") and value[1:] in renames:
+                el.set(name, "#" + renames[value[1:]])
+            elif "url(" in value:
+                el.set(name, URL_REF_RE.sub(swap, value))
+
+
+def merge_gradients(root: ET.Element) -> None:
+    canonical: dict[bytes, str] = {}
+    renames: dict[str, str] = {}
+    for el in root.iter():
+        if local_name(el.tag) not in GRADIENT_TAGS or "id" not in el.attrib:
+            continue
+        body = ET.Element(el.tag, {k: v for k, v in sorted(el.attrib.items()) if k != "id"})
+        body.extend(el)
+        key = ET.tostring(body)
+        if key in canonical:
+            renames[el.get("id")] = canonical[key]
+        else:
+            canonical[key] = el.get("id")
+    if renames:
+        rewrite_references(root, renames)
+
+
+def drop_unused_defs(root: ET.Element) -> None:
+    while True:
+        refs = referenced_ids(root)
+        removed = False
+        for defs in [el for el in root.iter() if local_name(el.tag) == "defs"]:
+            for child in list(defs):
+                if local_name(child.tag) in PRUNABLE_DEF_TAGS and child.get("id") not in refs:
+                    defs.remove(child)
+                    removed = True
+        if not removed:
+            break
+    parents = parent_map(root)
+    for defs in [el for el in root.iter() if local_name(el.tag) == "defs" and len(el) == 0]:
+        parents[defs].remove(defs)
+
+
+def fold_translations(root: ET.Element, precision: int) -> None:
+    for el in root.iter():
+        targets = TRANSLATE_TARGETS.get(local_name(el.tag))
+        value = el.get("transform")
+        if not targets or not value or len(el):
+            continue
+        # userSpaceOnUse paints are positioned in the transformed space; moving them is not safe.
+        if any("url(" in v for v in el.attrib.values()):
+            continue
+        matrix = parse_transform(value)
+        if matrix is None or not is_translation(matrix):
+            continue
+        coords = [el.get(name, "0") for name in targets]
+        if not all(NUMBER_RE.fullmatch(c) for c in coords):
+            continue
+        for name, coord, offset in zip(targets, coords, matrix[4:]):
+            el.set(name, format_number(float(coord) + offset, precision))
+        del el.attrib["transform"]
+
+
+def collapse_groups(root: ET.Element) -> None:
+    changed = True
+    while changed:
+        changed = False
+        parents = parent_map(root)
+        for group in [el for el in root.iter() if local_name(el.tag) == "g"]:
+            parent = parents.get(group)
+            if parent is None:
+                continue
+            if group.attrib:
+                children = [c for c in group if isinstance(c.tag, str)]
+                if len(children) != 1 or set(group.attrib) - MOVABLE_GROUP_ATTRS:
+                    continue
+                child = children[0]
+                if any(name != "transform" and name in child.attrib for name in group.attrib):
+                    continue
+                for name, value in group.attrib.items():
+                    if name == "transform" and "transform" in child.attrib:
+                        value = f"{value} {child.get('transform')}"
+                    child.set(name, value)
+            index = list(parent).index(group)
+            parent.remove(group)
+            for offset, child in enumerate(list(group)):
+                parent.insert(index + offset, child)
+            changed = True
+            break
+
+
+def strip_whitespace(root: ET.Element) -> None:
+    for el in root.iter():
+        if el.get(XML_SPACE) == "preserve":
+            continue
+        if local_name(el.tag) in ("text", "tspan", "title", "desc", "style"):
+            if el.text and len(el) == 0:
+                el.text = " ".join(el.text.split())
+        elif el.text and not el.text.strip():
+            el.text = None
+        if el.tail and not el.tail.strip():
+            el.tail = None
+
+
+def viewport_extent(root: ET.Element) -> float | None:
+    view_box = NUMBER_RE.findall(root.get("viewBox", ""))
+    if len(view_box) == 4:
+        return max(abs(float(view_box[2])), abs(float(view_box[3]))) or None
+    sizes = [float(m.group(0)) for m in (NUMBER_RE.match(root.get(n, "")) for n in ("width", "height")) if m]
+    return max(sizes) if sizes and max(sizes) > 0 else None
+
+
+def scaled_precision(root: ET.Element, precision: int) -> int:
+    # One user unit covers MAX_RENDER_PX / extent pixels, so small viewBoxes need more digits.
+    extent = viewport_extent(root)
+    if extent is None:
+        return precision
+    needed = math.ceil(math.log10(MAX_RENDER_PX / (extent * MAX_ROUNDING_PX)))
+    return max(precision, needed)
+
+
+def optimize_svg(data: bytes, precision: int) -> bytes:
+    root = parse_svg(data)
+    precision = scaled_precision(root, precision)
+    strip_editor_data(root)
+    collapse_groups(root)
+    round_attributes(root, precision)
+    merge_gradients(root)
+    drop_unused_defs(root)
+    fold_translations(root, precision)
+    strip_whitespace(root)
+    # ElementTree escapes ">" in text and attributes, so " />" only occurs at tag ends.
+    return ET.tostring(root, encoding="utf-8", xml_declaration=False).replace(b" />", b"/>") + b"\n"
+
+
+def count_elements(data: bytes) -> int:
+    return sum(1 for _ in parse_svg(data).iter())
+
+
+def raster_diff(before: bytes, after: bytes, size: int) -> int | None:
+    if cairosvg is None:
+        return None
+    images = [
+        Image.open(io.BytesIO(cairosvg.svg2png(bytestring=svg, output_width=size, output_height=size))).convert("RGBA")
+        for svg in (before, after)
+    ]
+    diff = ImageChops.difference(images[0], images[1])
+    return max(high for _, high in diff.getextrema())
+
+
+def process_file(path: str, precision: int, verify_size: int | None) -> SvgResult:
+    with open(path, "rb") as f:
+        before = f.read()
+    try:
+        after = optimize_svg(before, precision)
+        elements_before = count_elements(before)
+        elements_after = count_elements(after)
+        max_diff = raster_diff(before, after, verify_size) if verify_size else None
+    except Exception as e:
+        return SvgResult(path, len(before), len(before), 0, 0, None, error=f"{type(e).__name__}: {e}")
+    return SvgResult(path, len(before), len(after), elements_before, elements_after, max_diff, data=after)
+
+
+def collect_svgs(dirs: list[str]) -> list[str]:
+    paths: list[str] = []
+    for directory in dirs:
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".svg"):
+                paths.append(os.path.join(directory, name))
+    return paths
+
+
+def output_path(path: str, output_dir: str | None) -> str:
+    if not output_dir:
+        return path
+    directory, name = os.path.split(path)
+    return os.path.join(output_dir, os.path.basename(os.path.normpath(directory)), name)
+
+
+def prune_outputs(paths: list[str], output_dir: str) -> None:
+    # Copies of SVGs that no longer exist in the sources would otherwise be picked up downstream.
+    expected = {output_path(path, output_dir) for path in paths}
+    for directory in {os.path.dirname(path) for path in expected}:
+        for name in os.listdir(directory):
+            if name.endswith(".svg") and os.path.join(directory, name) not in expected:
+                os.remove(os.path.join(directory, name))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("dirs", nargs="*", default=DEFAULT_DIRS)
+    parser.add_argument("--precision", type=int, default=2, help="Minimum decimals kept for coordinates")
+    parser.add_argument("--tolerance", type=int, default=8, help="Max per-channel raster difference (0-255)")
+    parser.add_argument("--verify-size", type=int, default=256, help="Raster size for verification")
+    parser.add_argument("--no-verify", action="store_true", help="Write results without raster verification")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output-dir", default=None, help="Write optimized copies under <output-dir>/<input dir name>/")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    verify_size = None if args.no_verify else args.verify_size
+    if verify_size and cairosvg is None:
+        if not args.dry_run:
+            print("[error] cairosvg and Pillow are required to verify results (pip install cairosvg pillow), or pass --no-verify")
+            return 2
+        print("[warn] cairosvg/Pillow not installed; dry run without raster verification")
+        verify_size = None
+
+    paths = collect_svgs(args.dirs)
+    if args.output_dir and not args.dry_run:
+        for path in paths:
+            os.makedirs(os.path.dirname(output_path(path, args.output_dir)), exist_ok=True)
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(pool.map(process_file, paths, [args.precision] * len(paths), [verify_size] * len(paths)))
+
+    failed: list[str] = []
+    total_before = total_after = elements_before = elements_after = 0
+    for result in results:
+        if result.error:
+            failed.append(result.path)
+            print(f"[error] {result.path}: {result.error}")
+            continue
+        if verify_size and result.max_diff is None:
+            failed.append(result.path)
+            print(f"[reject] {result.path}: not verified")
+            continue
+        if result.max_diff is not None and result.max_diff > args.tolerance:
+            failed.append(result.path)
+            print(f"[reject] {result.path}: raster diff {result.max_diff} > {args.tolerance}")
+            continue
+
+        total_before += result.bytes_before
+        total_after += result.bytes_after
+        elements_before += result.elements_before
+        elements_after += result.elements_after
+        diff = "-" if result.max_diff is None else str(result.max_diff)
+        print(
+            f"[svg] {result.path}: {result.bytes_before} -> {result.bytes_after} B, "
+            f"{result.elements_before} -> {result.elements_after} elements, diff {diff}"
+        )
+        if not args.dry_run and result.bytes_after < result.bytes_before:
+            with open(output_path(result.path, args.output_dir), "wb") as f:
+                f.write(result.data)
+        elif not args.dry_run and args.output_dir:
+            shutil.copyfile(result.path, output_path(result.path, args.output_dir))
+
+    if args.output_dir and not args.dry_run:
+        for path in failed:
+            shutil.copyfile(path, output_path(path, args.output_dir))
+        prune_outputs(paths, args.output_dir)
+
+    saved = total_before - total_after
+    pct = 100.0 * saved / total_before if total_before else 0.0
+    print(
+        f"[total] {len(results) - len(failed)} files: {total_before} -> {total_after} B "
+        f"(-{pct:.1f}%), {elements_before} -> {elements_after} elements"
+    )
+
+    if failed:
+        print("[warn] Kept originals:", ", ".join(failed))
+        # With --output-dir the copy is still complete, so downstream stages can proceed.
+        return 0 if args.output_dir else 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,21 +3,45 @@ Pull best-matching 3D PNG icons from Iconscout pages.
 
 This script:
 1) Fetches Iconscout search/listing pages through r.jina.ai mirror.
-2) Extracts candidate CDN PNG URLs.
+2) Streams each listing and extracts candidate CDN PNG URLs as they arrive, stopping
+   early once --stop-after strong candidates have been seen for the concept.
 3) Scores candidates by concept keywords.
 4) Downloads the best icon for each concept into src/assets/icons3d.
+
+Concepts come from an external catalog (--catalog, see concept_catalog.py) read lazily,
+so the run scales to thousands of entries: queries shared by several concepts are
+fetched once, and the manifest is written line by line.
+
+Every HTTP request is timed (DNS, connect, TLS, first byte, total) and can be logged as
+JSON lines with --metrics-out; an end-of-run summary reports p50/p95/p99 latency and
+failures by category.
 """
 
 from __future__ import annotations
 
 import argparse
+import codecs
+import http.client
+import json
 import os
 import re
+import socket
 import ssl
+import time
 import urllib.error
+import urllib.parse
 import urllib.request
-from dataclasses import dataclass
+from array import array
+from collections import Counter
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import Callable
+
+from concept_catalog import DEFAULT_CATALOG, Concept, count_queries, iter_concepts
+
 
+MIRROR_BASE = "https://r.jina.ai/http://iconscout.com/3d-icons/"
+MAX_URL_LENGTH = 2048
 
 PNG_RE = re.compile(r"https://cdn3d\.iconscout\.com/3d/(?:premium|free)/thumb/[^\s\)\]]+?\.png")
 
@@ -33,48 +57,379 @@ CDN_HEADERS = {
 }
 
 
+RETRYABLE = {"timeout", "connect", "http_5xx", "http_429"}
+MAX_REDIRECTS = 5
+
+
 @dataclass
-class Concept:
-    out_name: str
-    queries: list[str]
-    include: list[str]
-    exclude: list[str]
-
-
-CONCEPTS: list[Concept] = [
-    Concept("ram-module", ["ram-module", "computer-ram"], ["ram"], ["battering", "zodiac", "lamb"]),
-    Concept("ssd-drive", ["ssd", "solid-state-drive"], ["ssd", "solid-state"], ["hard-disk"]),
-    Concept("cpu-chip", ["cpu-chip", "processor-chip"], ["cpu", "processor", "chip"], ["case-cpu"]),
-    Concept("gpu-card", ["gpu-card", "graphics-card"], ["gpu", "graphics-card", "graphic-card"], ["gift", "graph"]),
-    Concept("motherboard", ["motherboard"], ["motherboard"], []),
-    Concept("cooling-fan", ["cooling-fan", "computer-fan"], ["fan"], ["ceiling", "table-fan"]),
-    Concept("usb-drive", ["usb-drive", "flash-drive", "usb-flash-drive"], ["usb", "flash-drive"], ["plug", "cable"]),
-    Concept("hard-drive", ["hard-disk-drive", "hard-drive"], ["hard-disk", "hard-drive", "hdd"], ["ssd"]),
-    Concept("floppy-disk", ["floppy-disk"], ["floppy"], []),
-    Concept("cd", ["cd-disc", "compact-disc", "cd"], ["cd", "disc"], ["dvd-player"]),
-    Concept("hdmi-cable", ["hdmi-cable", "hdmi"], ["hdmi", "cable"], ["adapter-only"]),
-    Concept("circuit-board", ["circuit-board", "pcb-board"], ["circuit-board", "pcb", "motherboard"], ["board-game"]),
-    Concept("binary-pattern", ["binary", "digital-panel"], ["binary", "code", "digital"], ["bitcoin"]),
-    Concept("samsung-laptop-silhouette", ["samsung-laptop", "laptop"], ["samsung", "laptop"], ["tablet"]),
-    Concept("monitor-silhouette", ["computer-monitor", "monitor"], ["monitor"], ["tv-remote"]),
-    Concept("memory-chip", ["memory-chip", "chip-module"], ["memory-chip", "chip"], ["sd-card"]),
-]
-
-
-def fetch_text(url: str, headers: dict[str, str], timeout: int = 60) -> str:
-    req = urllib.request.Request(url, headers=headers)
-    context = ssl.create_default_context()
-    with urllib.request.urlopen(req, timeout=timeout, context=context) as resp:
-        return resp.read().decode("utf-8", "ignore")
-
-
-def fetch_candidates(query: str) -> list[str]:
-    mirror_url = f"https://r.jina.ai/http://iconscout.com/3d-icons/{query}"
-    text = fetch_text(mirror_url, MIRROR_HEADERS)
-    return sorted(set(PNG_RE.findall(text)))
-
-
-def score_url(url: str, include: list[str], exclude: list[str]) -> int:
+class PullOptions:
+    timeout: int = 60
+    retries: int = 1
+    mirror_base: str = MIRROR_BASE
+    chunk_size: int = 64 * 1024
+    strong_score: int = 5
+    stop_after: int = 20
+
+
+class FetchError(Exception):
+    def __init__(self, category: str, detail: str, status: int | None = None) -> None:
+        super().__init__(f"{category}: {detail}")
+        self.category = category
+        self.detail = detail
+        self.status = status
+
+
+@dataclass
+class RequestMetrics:
+    url: str
+    kind: str
+    concept: str | None = None
+    status: int | None = None
+    dns_ms: float = 0.0
+    connect_ms: float = 0.0
+    tls_ms: float = 0.0
+    first_byte_ms: float = 0.0
+    total_ms: float = 0.0
+    bytes: int = 0
+    retries: int = 0
+    redirects: int = 0
+    first_candidate_ms: float | None = None
+    stopped_early: bool = False
+    cache: str = "miss"
+    error: str | None = None
+    detail: str | None = None
+
+
+@dataclass
+class KindStats:
+    requests: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    bytes: int = 0
+    stopped_early: int = 0
+    latencies_ms: array = field(default_factory=lambda: array("d"))
+    first_candidate_ms: array = field(default_factory=lambda: array("d"))
+    failures: Counter = field(default_factory=Counter)
+
+
+@dataclass
+class MetricsLog:
+    out: object | None = None
+    # Aggregates only, so memory stays proportional to request count in flat float arrays.
+    kinds: dict[str, KindStats] = field(default_factory=dict)
+
+    def emit(self, event: str, payload: dict) -> None:
+        if self.out is not None:
+            self.out.write(json.dumps({"event": event, **payload}) + "\n")
+
+    def record_request(self, metrics: RequestMetrics) -> None:
+        stats = self.kinds.setdefault(metrics.kind, KindStats())
+        stats.requests += 1
+        stats.retries += metrics.retries
+        stats.bytes += metrics.bytes
+        stats.stopped_early += metrics.stopped_early
+        if metrics.cache == "hit":
+            stats.cache_hits += 1
+        elif metrics.error:
+            stats.failures[metrics.error] += 1
+        else:
+            stats.latencies_ms.append(metrics.total_ms)
+        if metrics.first_candidate_ms is not None:
+            stats.first_candidate_ms.append(metrics.first_candidate_ms)
+        self.emit("request", {k: round(v, 3) if isinstance(v, float) else v for k, v in asdict(metrics).items()})
+
+    def record_concept(self, concept: str, candidates: int, scoring_ms: float, best_score: int | None) -> None:
+        self.emit("concept", {"concept": concept, "candidates": candidates, "scoring_ms": round(scoring_ms, 3), "best_score": best_score})
+
+    def summary(self) -> dict:
+        result: dict = {}
+        for kind, stats in sorted(self.kinds.items()):
+            ok = sorted(stats.latencies_ms)
+            result[kind] = {
+                "requests": stats.requests,
+                "cache_hits": stats.cache_hits,
+                "retries": stats.retries,
+                "bytes": stats.bytes,
+                "p50_ms": percentile(ok, 50),
+                "p95_ms": percentile(ok, 95),
+                "p99_ms": percentile(ok, 99),
+                "first_candidate_p50_ms": percentile(sorted(stats.first_candidate_ms), 50),
+                "stopped_early": stats.stopped_early,
+                "failures": dict(stats.failures),
+            }
+        return result
+
+
+def percentile(sorted_values: list[float], pct: float) -> float | None:
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return round(sorted_values[int(rank) - 1], 3)
+
+
+def elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000.0
+
+
+class CandidateExtractor:
+    """Incrementally pulls PNG_RE matches out of a streamed response body."""
+
+    def __init__(self, score: Callable[[str], int] | None = None, strong_score: int = 5, stop_after: int = 0) -> None:
+        self.score = score
+        self.strong_score = strong_score
+        self.stop_after = stop_after
+        self.urls: dict[str, None] = {}
+        self.strong = 0
+        self.restart()
+
+    def restart(self, started: float | None = None) -> None:
+        # Called per request: decoding state and time-to-first-candidate do not carry over.
+        self.decoder = codecs.getincrementaldecoder("utf-8")("ignore")
+        self.buffer = ""
+        self.started = time.perf_counter() if started is None else started
+        self.first_candidate_ms: float | None = None
+
+    def feed(self, chunk: bytes) -> bool:
+        text = self.buffer + self.decoder.decode(chunk)
+        end = 0
+        for match in PNG_RE.finditer(text):
+            if self.first_candidate_ms is None:
+                self.first_candidate_ms = elapsed_ms(self.started)
+            self.add(match.group(0))
+            end = match.end()
+        # A URL cut by the chunk boundary starts within the last MAX_URL_LENGTH characters.
+        self.buffer = text[max(end, len(text) - MAX_URL_LENGTH) :]
+        return not self.done
+
+    def add(self, url: str) -> None:
+        if url in self.urls:
+            return
+        self.urls[url] = None
+        if self.score is not None and self.score(url) >= self.strong_score:
+            self.strong += 1
+
+    @property
+    def done(self) -> bool:
+        return self.stop_after > 0 and self.strong >= self.stop_after
+
+
+def read_body(response, options: PullOptions, metrics: RequestMetrics, sink: CandidateExtractor | None) -> bytes:
+    if sink is None or response.status != 200:
+        body = response.read()
+        metrics.bytes += len(body)
+        return body
+    # Stream the body so large listing pages never sit in memory whole.
+    while chunk := response.read(options.chunk_size):
+        metrics.bytes += len(chunk)
+        if not sink.feed(chunk):
+            metrics.stopped_early = True
+            break
+    return b""
+
+
+def request_via_proxy(
+    url: str,
+    headers: dict[str, str],
+    options: PullOptions,
+    metrics: RequestMetrics,
+    sink: CandidateExtractor | None = None,
+) -> tuple[int, dict[str, str], bytes]:
+    # urllib honours the *_PROXY environment; only first byte and total are timed here.
+    start = time.perf_counter()
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        try:
+            response = urllib.request.urlopen(request, timeout=options.timeout, context=ssl.create_default_context())
+        except urllib.error.HTTPError as e:
+            response = e
+        with response:
+            metrics.first_byte_ms += elapsed_ms(start)
+            body = read_body(response, options, metrics, sink)
+            return response.status, {k.lower(): v for k, v in response.headers.items()}, body
+    except urllib.error.URLError as e:
+        reason = e.reason
+        if isinstance(reason, socket.timeout):
+            raise FetchError("timeout", "proxy request timed out") from e
+        if isinstance(reason, ssl.SSLError):
+            raise FetchError("tls", str(reason)) from e
+        raise FetchError("connect", str(reason)) from e
+    except socket.timeout as e:
+        raise FetchError("timeout", "read timed out") from e
+    except ssl.SSLError as e:
+        raise FetchError("tls", f"{type(e).__name__}: {e}") from e
+    except (http.client.HTTPException, OSError) as e:
+        raise FetchError("protocol", f"{type(e).__name__}: {e}") from e
+
+
+def request_once(
+    url: str,
+    headers: dict[str, str],
+    options: PullOptions,
+    metrics: RequestMetrics,
+    sink: CandidateExtractor | None = None,
+) -> tuple[int, dict[str, str], bytes]:
+    parts = urllib.parse.urlsplit(url)
+    secure = parts.scheme == "https"
+    host = parts.hostname or ""
+    port = parts.port or (443 if secure else 80)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    if parts.scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(host):
+        return request_via_proxy(url, headers, options, metrics, sink)
+
+    # The lookup is timed on its own; create_connection() then tries every address it
+    # returns (IPv6 and IPv4), usually answered from the resolver cache.
+    start = time.perf_counter()
+    try:
+        socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        raise FetchError("dns", str(e)) from e
+    metrics.dns_ms += elapsed_ms(start)
+
+    phase = time.perf_counter()
+    try:
+        sock = socket.create_connection((host, port), timeout=options.timeout)
+    except socket.timeout as e:
+        raise FetchError("timeout", "connect timed out") from e
+    except OSError as e:
+        raise FetchError("connect", str(e)) from e
+    metrics.connect_ms += elapsed_ms(phase)
+
+    conn: http.client.HTTPConnection | None = None
+    response: http.client.HTTPResponse | None = None
+    try:
+        if secure:
+            phase = time.perf_counter()
+            try:
+                sock = ssl.create_default_context().wrap_socket(sock, server_hostname=host)
+            except ssl.SSLError as e:
+                raise FetchError("tls", str(e)) from e
+            metrics.tls_ms += elapsed_ms(phase)
+
+        conn_cls = http.client.HTTPSConnection if secure else http.client.HTTPConnection
+        conn = conn_cls(host, port, timeout=options.timeout)
+        conn.sock = sock
+        conn.request("GET", path, headers={"Host": parts.netloc, **headers})
+        response = conn.getresponse()
+        metrics.first_byte_ms += elapsed_ms(start)
+        body = read_body(response, options, metrics, sink)
+        return response.status, {k.lower(): v for k, v in response.getheaders()}, body
+    except socket.timeout as e:
+        raise FetchError("timeout", "read timed out") from e
+    except ssl.SSLError as e:
+        raise FetchError("tls", f"{type(e).__name__}: {e}") from e
+    except (http.client.HTTPException, OSError) as e:
+        # Anything else failing mid-request (resets, broken pipes) is a protocol-level error.
+        raise FetchError("protocol", f"{type(e).__name__}: {e}") from e
+    finally:
+        if response is not None:
+            response.close()
+        if conn is not None:
+            conn.close()
+        sock.close()
+
+
+def fetch_bytes(
+    url: str,
+    headers: dict[str, str],
+    log: MetricsLog,
+    kind: str,
+    options: PullOptions,
+    concept: str | None = None,
+    sink: CandidateExtractor | None = None,
+) -> bytes:
+    metrics = RequestMetrics(url=url, kind=kind, concept=concept)
+    start = time.perf_counter()
+    try:
+        while True:
+            try:
+                target = url
+                if sink is not None:
+                    sink.restart(start)
+                for _ in range(MAX_REDIRECTS + 1):
+                    status, response_headers, body = request_once(target, headers, options, metrics, sink)
+                    metrics.status = status
+                    if status in (301, 302, 303, 307, 308) and "location" in response_headers:
+                        target = urllib.parse.urljoin(target, response_headers["location"])
+                        metrics.redirects += 1
+                        continue
+                    break
+                else:
+                    raise FetchError("protocol", "too many redirects", status)
+                if status == 429:
+                    raise FetchError("http_429", target, status)
+                if status >= 400:
+                    raise FetchError(f"http_{status // 100}xx", target, status)
+                return body
+            except FetchError as e:
+                if e.category not in RETRYABLE or metrics.retries >= options.retries:
+                    raise
+                metrics.retries += 1
+                time.sleep(0.5 * 2 ** (metrics.retries - 1))
+    except FetchError as e:
+        metrics.error = e.category
+        metrics.detail = e.detail
+        raise
+    finally:
+        metrics.total_ms = elapsed_ms(start)
+        if sink is not None:
+            metrics.first_candidate_ms = sink.first_candidate_ms
+        log.record_request(metrics)
+
+
+class QueryCache:
+    """Candidate lists for queries that later concepts still need; dropped after last use."""
+
+    def __init__(self, refs: Counter[str]) -> None:
+        self.refs = Counter({query: n for query, n in refs.items() if n > 1})
+        self.entries: dict[str, list[str]] = {}
+
+    def shared(self, query: str) -> bool:
+        return query in self.refs
+
+    def release(self, query: str) -> None:
+        if query not in self.refs:
+            return
+        self.refs[query] -= 1
+        if self.refs[query] <= 0:
+            del self.refs[query]
+            self.entries.pop(query, None)
+
+
+def fetch_candidates(
+    query: str,
+    log: MetricsLog,
+    options: PullOptions,
+    cache: QueryCache,
+    concept: str | None = None,
+    extractor: CandidateExtractor | None = None,
+) -> list[str]:
+    mirror_url = f"{options.mirror_base}{query}"
+    extractor = extractor or CandidateExtractor()
+    try:
+        if query in cache.entries:
+            log.record_request(RequestMetrics(url=mirror_url, kind="mirror", concept=concept, cache="hit"))
+            urls = cache.entries[query]
+        elif cache.shared(query):
+            # Other concepts will reuse this listing, so read it fully instead of cutting off.
+            full = CandidateExtractor()
+            fetch_bytes(mirror_url, MIRROR_HEADERS, log, "mirror", options, concept, sink=full)
+            urls = cache.entries[query] = list(full.urls)
+        else:
+            seen_before = len(extractor.urls)
+            fetch_bytes(mirror_url, MIRROR_HEADERS, log, "mirror", options, concept, sink=extractor)
+            return list(extractor.urls)[seen_before:]
+    finally:
+        cache.release(query)
+
+    for url in urls:
+        extractor.add(url)
+    return urls
+
+
+def score_url(url: str, include: tuple[str, ...], exclude: tuple[str, ...]) -> int:
     lower = url.lower()
     score = 0
     for token in include:
@@ -88,16 +443,31 @@ def score_url(url: str, include: list[str], exclude: list[str]) -> int:
     return score
 
 
-def pick_best(concept: Concept) -> tuple[str | None, list[tuple[int, str]]]:
-    pool: set[str] = set()
-    for q in concept.queries:
+def pick_best(
+    concept: Concept,
+    log: MetricsLog,
+    options: PullOptions,
+    cache: QueryCache,
+) -> tuple[str | None, list[tuple[int, str]]]:
+    extractor = CandidateExtractor(
+        score=lambda u: score_url(u, concept.include, concept.exclude),
+        strong_score=options.strong_score,
+        stop_after=options.stop_after,
+    )
+    for q in dict.fromkeys(concept.queries):
+        if extractor.done:
+            cache.release(q)
+            continue
         try:
-            urls = fetch_candidates(q)
-            pool.update(urls)
-        except Exception:
+            fetch_candidates(q, log, options, cache, concept.out_name, extractor)
+        except FetchError as e:
+            print(f"[warn] {concept.out_name}: query {q!r} failed ({e.category}: {e.detail})")
             continue
 
+    pool = extractor.urls
+    start = time.perf_counter()
     scored = sorted(((score_url(u, concept.include, concept.exclude), u) for u in pool), reverse=True)
+    log.record_concept(concept.out_name, len(pool), elapsed_ms(start), scored[0][0] if scored else None)
     if not scored:
         return None, []
 
@@ -107,58 +477,97 @@ def pick_best(concept: Concept) -> tuple[str | None, list[tuple[int, str]]]:
     return best_url, scored[:10]
 
 
-def download_png(url: str, out_path: str) -> None:
-    req = urllib.request.Request(url, headers=CDN_HEADERS)
-    context = ssl.create_default_context()
-    with urllib.request.urlopen(req, timeout=60, context=context) as resp:
-        data = resp.read()
+def download_png(url: str, out_path: str, log: MetricsLog, options: PullOptions, concept: str | None = None) -> None:
+    data = fetch_bytes(url, CDN_HEADERS, log, "cdn", options, concept)
     with open(out_path, "wb") as f:
         f.write(data)
 
 
+def print_summary(summary: dict) -> None:
+    for kind, stats in summary.items():
+        print(
+            f"[metrics] {kind}: {stats['requests']} requests ({stats['cache_hits']} cached, "
+            f"{stats['retries']} retries), {stats['bytes']} B, "
+            f"p50 {stats['p50_ms']} ms / p95 {stats['p95_ms']} ms / p99 {stats['p99_ms']} ms"
+        )
+        if stats["first_candidate_p50_ms"] is not None:
+            print(
+                f"[metrics] {kind}: first candidate p50 {stats['first_candidate_p50_ms']} ms, "
+                f"{stats['stopped_early']} listings cut off early"
+            )
+        for category, count in sorted(stats["failures"].items()):
+            print(f"[metrics] {kind} failures: {category} x{count}")
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--output-dir", default="src/assets/icons3d")
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG, help="Concept catalog (.jsonl, .json or .toml)")
     parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--retries", type=int, default=1, help="Retries for timeouts, connect errors, 429 and 5xx")
+    parser.add_argument("--mirror-base", default=MIRROR_BASE, help="Listing URL prefix; the query is appended")
+    parser.add_argument("--stop-after", type=int, default=20, help="Stop reading a concept's listings after this many strong candidates (0 = read all)")
+    parser.add_argument("--strong-score", type=int, default=5, help="Minimum score_url() value counted as a strong candidate")
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024, help="Bytes read per chunk when streaming listings")
+    parser.add_argument("--metrics-out", default=None, help="Write per-request/per-concept metrics as JSON lines")
     args = parser.parse_args()
 
     os.makedirs(args.output_dir, exist_ok=True)
-    manifest_lines = ["# Iconscout Pulled Icons", "", "Chosen sources:"]
-
-    failed: list[str] = []
-    for concept in CONCEPTS:
-        best_url, preview = pick_best(concept)
-        if not best_url:
-            failed.append(concept.out_name)
-            manifest_lines.append(f"- {concept.out_name}: NOT_FOUND")
-            continue
 
-        out_path = os.path.join(args.output_dir, f"{concept.out_name}.png")
-        print(f"[pick] {concept.out_name} -> {best_url}")
-        if not args.dry_run:
-            try:
-                download_png(best_url, out_path)
-            except urllib.error.HTTPError as e:
-                failed.append(concept.out_name)
-                manifest_lines.append(f"- {concept.out_name}: HTTP_{e.code} {best_url}")
-                continue
-            except Exception:
-                failed.append(concept.out_name)
-                manifest_lines.append(f"- {concept.out_name}: DOWNLOAD_ERROR {best_url}")
-                continue
-
-        manifest_lines.append(f"- {concept.out_name}: {best_url}")
-
-        if preview:
-            for s, u in preview[:3]:
-                print(f"  [alt {s:>2}] {u}")
-
-    manifest_path = os.path.join(args.output_dir, "iconscout-manifest.md")
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(manifest_lines) + "\n")
+    options = PullOptions(
+        retries=args.retries,
+        mirror_base=args.mirror_base,
+        chunk_size=args.chunk_size,
+        strong_score=args.strong_score,
+        stop_after=args.stop_after,
+    )
+    with open(args.metrics_out, "w", encoding="utf-8") if args.metrics_out else nullcontext() as metrics_file:
+        log = MetricsLog(out=metrics_file)
+
+        # First lazy pass only counts query references; the second does the work.
+        cache = QueryCache(count_queries(args.catalog))
+        failed = 0
+        manifest_path = os.path.join(args.output_dir, "iconscout-manifest.md")
+        with open(manifest_path, "w", encoding="utf-8") as manifest:
+            manifest.write("# Iconscout Pulled Icons\n\nChosen sources:\n")
+            for concept in iter_concepts(args.catalog):
+                best_url, preview = pick_best(concept, log, options, cache)
+                if not best_url:
+                    failed += 1
+                    print(f"[miss] {concept.out_name}")
+                    manifest.write(f"- {concept.out_name}: NOT_FOUND\n")
+                    continue
+
+                out_path = os.path.join(args.output_dir, f"{concept.out_name}.png")
+                print(f"[pick] {concept.out_name} -> {best_url}")
+                if not args.dry_run:
+                    try:
+                        download_png(best_url, out_path, log, options, concept.out_name)
+                    except FetchError as e:
+                        failed += 1
+                        label = f"HTTP_{e.status}" if e.status and e.status >= 400 else f"DOWNLOAD_ERROR_{e.category.upper()}"
+                        print(f"[miss] {concept.out_name}: {label}")
+                        manifest.write(f"- {concept.out_name}: {label} {best_url}\n")
+                        continue
+                    except OSError:
+                        failed += 1
+                        print(f"[miss] {concept.out_name}: DOWNLOAD_ERROR")
+                        manifest.write(f"- {concept.out_name}: DOWNLOAD_ERROR {best_url}\n")
+                        continue
+
+                manifest.write(f"- {concept.out_name}: {best_url}\n")
+                manifest.flush()
+
+                if preview:
+                    for s, u in preview[:3]:
+                        print(f"  [alt {s:>2}] {u}")
+
+        summary = log.summary()
+        log.emit("summary", summary)
+    print_summary(summary)
 
     if failed:
-        print("[warn] Missing/failed:", ", ".join(failed))
+        print(f"[warn] {failed} concept(s) missing/failed; see {manifest_path}")
         return 1
     return 0
 
@@ -0,0 +1,125 @@
+"""
+Pre-bake PNG rasters of the card-face SVGs for each shipped device pixel ratio.
+
+This script:
+1) Hashes every SVG in src/assets/cards-vivid.
+2) Rasterizes each one at --card-size x each --densities value on a process pool.
+3) Caches rasters in .cache/card-rasters keyed by SVG content hash and pixel size,
+   so an unchanged SVG is never rasterized again.
+4) Writes <id>@<n>x.png files plus manifest.json into src/assets/cards-raster.
+
+cardCatalog.ts picks the rasters up by file name and serves them as an <img> srcset.
+Requires cairosvg.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+from index_assets import hash_file
+
+try:
+    import cairosvg
+except ImportError:
+    cairosvg = None
+
+
+CACHE_DIR = ".cache/card-rasters"
+
+
+def rasterize(svg_path: str, out_path: str, px: int) -> str:
+    tmp_path = out_path + ".tmp"
+    cairosvg.svg2png(url=svg_path, write_to=tmp_path, output_width=px, output_height=px)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+def load_manifest(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input-dir", default="src/assets/cards-vivid")
+    parser.add_argument("--output-dir", default="src/assets/cards-raster")
+    parser.add_argument("--card-size", type=int, default=256, help="Card art size in CSS pixels at 1x")
+    parser.add_argument("--densities", default="1,2,3", help="Comma-separated device pixel ratios")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    args = parser.parse_args()
+
+    if cairosvg is None:
+        print("[error] cairosvg is required: pip install cairosvg")
+        return 2
+
+    densities = sorted({int(d) for d in args.densities.split(",") if d.strip()})
+    os.makedirs(args.output_dir, exist_ok=True)
+    os.makedirs(args.cache_dir, exist_ok=True)
+
+    manifest_path = os.path.join(args.output_dir, "manifest.json")
+    previous = load_manifest(manifest_path).get("cards", {})
+
+    cards: dict[str, dict] = {}
+    pending: dict[str, tuple[str, int]] = {}
+    outputs: list[tuple[str, str]] = []
+    for name in sorted(os.listdir(args.input_dir)):
+        if not name.endswith(".svg"):
+            continue
+        icon_id = name[:-4]
+        svg_path = os.path.join(args.input_dir, name)
+        digest = hash_file(svg_path)
+        files = {}
+        keys = {}
+        previous_keys = previous.get(icon_id, {}).get("keys", {})
+        for density in densities:
+            px = args.card_size * density
+            # The cache key covers content and pixel size, so a --card-size change is stale too.
+            key = f"{digest[:16]}-{px}"
+            cache_path = os.path.join(args.cache_dir, f"{key}.png")
+            out_name = f"{icon_id}@{density}x.png"
+            files[str(density)] = out_name
+            keys[str(density)] = key
+            if not os.path.exists(cache_path):
+                pending[cache_path] = (svg_path, px)
+            out_path = os.path.join(args.output_dir, out_name)
+            if previous_keys.get(str(density)) != key or not os.path.exists(out_path):
+                outputs.append((cache_path, out_path))
+        cards[icon_id] = {"sha256": digest, "files": files, "keys": keys}
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = [pool.submit(rasterize, svg, cache_path, px) for cache_path, (svg, px) in pending.items()]
+            for future in futures:
+                print(f"[raster] {future.result()}")
+
+    for cache_path, out_path in outputs:
+        shutil.copyfile(cache_path, out_path)
+
+    # Rasters for SVGs that no longer exist would otherwise stay in the srcset glob.
+    expected = {name for card in cards.values() for name in card["files"].values()}
+    for name in os.listdir(args.output_dir):
+        if name.endswith(".png") and name not in expected:
+            os.remove(os.path.join(args.output_dir, name))
+
+    manifest = {"cardSize": args.card_size, "densities": densities, "cards": cards}
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    print(
+        f"[raster] {len(cards)} cards x {len(densities)} densities: "
+        f"{len(pending)} rasterized, {len(outputs)} updated -> {manifest_path}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,36 +3,35 @@ Render Samsung-style 3D hardware icons with transparent backgrounds.
 
 Usage:
   "C:\\Program Files\\Blender Foundation\\Blender 4.1\\blender.exe" --background --python scripts/render_hardware_icons_blender.py -- --output-dir src/assets/icons3d
+
+With --denoise deferred, each icon is written as a noisy multilayer EXR (beauty plus
+denoising albedo/normal passes) into --exr-dir, and the PNGs are produced afterwards by
+scripts/denoise_hardware_icons_blender.py in one batch.
+
+With --calibrate, a representative subset of icons is rendered under a grid of Cycles
+thread counts, tile sizes and BVH settings, timing each run and reading peak render
+memory from the render stats. The fastest configuration and a recommended split between
+parallel Blender processes and threads per process are saved to a per-host profile
+(.cache/cycles-profile-<hostname>.json), which later renders load automatically:
+  blender --background --python scripts/render_hardware_icons_blender.py -- --calibrate
 """
 
 import argparse
+import itertools
+import json
 import math
 import os
 import random
+import re
+import socket
 import sys
+import time
 
 import bpy
 from mathutils import Vector
 
 
-ICON_IDS = [
-    "ram-module",
-    "ssd-drive",
-    "cpu-chip",
-    "gpu-card",
-    "motherboard",
-    "cooling-fan",
-    "usb-drive",
-    "hard-drive",
-    "floppy-disk",
-    "cd",
-    "hdmi-cable",
-    "circuit-board",
-    "binary-pattern",
-    "samsung-laptop-silhouette",
-    "monitor-silhouette",
-    "memory-chip",
-]
+PROFILE_PATH = f".cache/cycles-profile-{socket.gethostname()}.json"
 
 
 def parse_args() -> argparse.Namespace:
@@ -47,6 +46,17 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--size", type=int, default=1024)
     parser.add_argument("--samples", type=int, default=96)
     parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--only", default="", help="Comma-separated icon ids to render (default: all)")
+    parser.add_argument("--denoise", choices=("inline", "deferred"), default="inline")
+    parser.add_argument("--exr-dir", default=None, help="Noisy EXR output for --denoise deferred (default: <output-dir>/_noisy)")
+    parser.add_argument("--threads", type=int, default=0, help="Cycles render threads (default: host profile, else automatic)")
+    parser.add_argument("--profile", default=PROFILE_PATH, help="Per-host tuning profile written by --calibrate")
+    parser.add_argument("--no-profile", action="store_true", help="Ignore the host profile and use Blender defaults")
+    parser.add_argument("--calibrate", action="store_true", help="Benchmark tuning settings and write --profile")
+    parser.add_argument("--calibrate-icons", default="gpu-card,cooling-fan,samsung-laptop-silhouette")
+    parser.add_argument("--calibrate-threads", default="", help="Comma-separated thread counts (default: powers of two up to the core count)")
+    parser.add_argument("--calibrate-tiles", default="0,256,1024", help="Comma-separated tile sizes; 0 renders the frame as one tile")
+    parser.add_argument("--calibrate-repeats", type=int, default=1, help="Runs per configuration; the fastest is kept")
     return parser.parse_args(argv)
 
 
@@ -316,18 +326,51 @@ def add_curve_cable(
     return obj
 
 
-def configure_scene(size: int, samples: int, seed: int) -> dict[str, bpy.types.Material]:
+def configure_output(scene: bpy.types.Scene, deferred_denoise: bool) -> None:
+    settings = scene.render.image_settings
+    if deferred_denoise:
+        # Keep the noisy beauty plus the denoiser's guide passes; OIDN runs later in batch.
+        scene.cycles.use_denoising = False
+        scene.view_layers[0].cycles.denoising_store_passes = True
+        settings.file_format = "OPEN_EXR_MULTILAYER"
+        settings.color_depth = "32"
+        settings.exr_codec = "ZIP"
+    else:
+        scene.cycles.use_denoising = True
+        scene.view_layers[0].cycles.denoising_store_passes = False
+        settings.file_format = "PNG"
+    settings.color_mode = "RGBA"
+
+
+def configure_performance(scene: bpy.types.Scene, tuning: dict) -> None:
+    # Keys left out of the tuning keep Blender's defaults.
+    if "threads" in tuning:
+        scene.render.threads_mode = "FIXED" if tuning["threads"] else "AUTO"
+        if tuning["threads"]:
+            scene.render.threads = tuning["threads"]
+    if "tile_size" in tuning:
+        scene.cycles.use_auto_tile = tuning["tile_size"] > 0
+        if tuning["tile_size"] > 0:
+            scene.cycles.tile_size = tuning["tile_size"]
+    if "spatial_splits" in tuning:
+        scene.cycles.debug_use_spatial_splits = tuning["spatial_splits"]
+    if "persistent_data" in tuning:
+        scene.render.use_persistent_data = tuning["persistent_data"]
+
+
+def configure_scene(
+    size: int, samples: int, seed: int, deferred_denoise: bool = False, tuning: dict | None = None
+) -> dict[str, bpy.types.Material]:
     scene = bpy.context.scene
     scene.render.engine = "CYCLES"
+    configure_performance(scene, tuning or {})
     scene.cycles.samples = samples
     scene.cycles.use_adaptive_sampling = True
-    scene.cycles.use_denoising = True
     scene.cycles.seed = seed
     scene.render.resolution_x = size
     scene.render.resolution_y = size
     scene.render.resolution_percentage = 100
-    scene.render.image_settings.file_format = "PNG"
-    scene.render.image_settings.color_mode = "RGBA"
+    configure_output(scene, deferred_denoise)
     scene.render.film_transparent = True
 
     world = bpy.data.worlds.new("IconWorld")
@@ -689,25 +732,178 @@ BUILDERS = {
     "memory-chip": build_memory_chip,
 }
 
+# Render order; ids match the concept catalog (scripts/hardware_concepts.jsonl).
+ICON_IDS = list(BUILDERS)
+
+# Headroom for Blender itself on top of the Cycles peak when sizing parallel processes.
+PROCESS_OVERHEAD_MB = 400
+MEMORY_BUDGET = 0.75
+
+PEAK_RE = re.compile(r"Peak:? ?([\d.]+)([KMG])")
+UNIT_MB = {"K": 1 / 1024, "M": 1.0, "G": 1024.0}
+
+
+def load_profile(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def host_memory_mb() -> float | None:
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / 2**20
+    except (AttributeError, ValueError, OSError):
+        return None
 
-def render_icon(icon_id: str, output_path: str, args: argparse.Namespace) -> None:
+
+def render_icon(icon_id: str, output_path: str | None, args: argparse.Namespace, tuning: dict) -> None:
     clear_scene()
-    materials = configure_scene(args.size, args.samples, args.seed)
+    materials = configure_scene(args.size, args.samples, args.seed, args.denoise == "deferred", tuning)
     builder = BUILDERS[icon_id]
     builder(materials)
-    bpy.context.scene.render.filepath = output_path
-    bpy.ops.render.render(write_still=True)
+    bpy.context.scene.render.filepath = output_path or ""
+    bpy.ops.render.render(write_still=output_path is not None)
+
+
+def measure(icon_ids: list[str], args: argparse.Namespace, tuning: dict) -> tuple[float, float | None]:
+    peak: list[float] = []
+
+    def on_stats(stats: str) -> None:
+        # Stats carry Blender's overall peak and the render device's peak; keep the larger.
+        peak.extend(float(value) * UNIT_MB[unit] for value, unit in PEAK_RE.findall(stats))
+
+    bpy.app.handlers.render_stats.append(on_stats)
+    try:
+        best = math.inf
+        for _ in range(max(1, args.calibrate_repeats)):
+            started = time.perf_counter()
+            for icon_id in icon_ids:
+                render_icon(icon_id, None, args, tuning)
+            best = min(best, time.perf_counter() - started)
+    finally:
+        bpy.app.handlers.render_stats.remove(on_stats)
+    return best, max(peak) if peak else None
+
+
+def recommend_split(by_threads: list[dict], cores: int, memory_mb: float | None, icons: int) -> dict:
+    # Assumes processes scale independently; memory bandwidth contention is not modelled.
+    best: dict = {}
+    for result in by_threads:
+        processes = max(1, cores // result["threads"])
+        if memory_mb and result["peak_mb"]:
+            per_process = result["peak_mb"] + PROCESS_OVERHEAD_MB
+            processes = max(1, min(processes, int(memory_mb * MEMORY_BUDGET // per_process)))
+        throughput = processes * icons * 60 / result["seconds"]
+        if throughput > best.get("icons_per_minute", 0):
+            best = {"processes": processes, "threads": result["threads"], "icons_per_minute": round(throughput, 2)}
+    return best
+
+
+def describe(tuning: dict) -> str:
+    return " ".join(f"{key}={value}" for key, value in tuning.items())
+
+
+def calibrate(args: argparse.Namespace) -> None:
+    icon_ids = [i.strip() for i in args.calibrate_icons.split(",") if i.strip()]
+    unknown = [icon_id for icon_id in icon_ids if icon_id not in BUILDERS]
+    if unknown:
+        raise SystemExit(f"[calibrate] unknown icon ids: {', '.join(unknown)}")
+    cores = os.cpu_count() or 1
+    threads = sorted({int(t) for t in args.calibrate_threads.split(",") if t.strip()}) or sorted(
+        {min(2**i, cores) for i in range(cores.bit_length() + 1)}
+    )
+    tiles = [int(t) for t in args.calibrate_tiles.split(",") if t.strip()]
+    results: list[dict] = []
+
+    def run(tuning: dict) -> dict:
+        seconds, peak_mb = measure(icon_ids, args, tuning)
+        result = {**tuning, "seconds": round(seconds, 3), "peak_mb": round(peak_mb, 1) if peak_mb else None}
+        results.append(result)
+        print(f"[calibrate] {describe(tuning)}: {seconds:.2f}s, peak {peak_mb or 0:.0f} MB")
+        return result
+
+    # Thread counts are swept with default tiles/BVH first; the full tile x BVH grid then
+    # runs at the fastest count instead of multiplying every axis together.
+    by_threads = [run({"threads": t}) for t in threads]
+    fastest_threads = min(by_threads, key=lambda r: r["seconds"])["threads"]
+    for tile_size, spatial_splits, persistent_data in itertools.product(tiles, (False, True), (False, True)):
+        run(
+            {
+                "threads": fastest_threads,
+                "tile_size": tile_size,
+                "spatial_splits": spatial_splits,
+                "persistent_data": persistent_data,
+            }
+        )
+
+    best = min(results, key=lambda r: r["seconds"])
+    memory_mb = host_memory_mb()
+    profile = {
+        "host": socket.gethostname(),
+        "blender": bpy.app.version_string,
+        "cores": cores,
+        "memory_mb": round(memory_mb) if memory_mb else None,
+        "size": args.size,
+        "samples": args.samples,
+        "icons": icon_ids,
+        "tuning": {k: v for k, v in best.items() if k not in ("seconds", "peak_mb")},
+        "recommended": recommend_split(by_threads, cores, memory_mb, len(icon_ids)),
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.profile)), exist_ok=True)
+    with open(args.profile, "w", encoding="utf-8") as f:
+        json.dump(profile, f, indent=2)
+        f.write("\n")
+
+    split = profile["recommended"]
+    print(f"[calibrate] best: {describe(profile['tuning'])} ({best['seconds']:.2f}s)")
+    print(
+        f"[calibrate] recommended for batch renders: {split['processes']} processes x {split['threads']} threads "
+        f"(~{split['icons_per_minute']} icons/min)"
+    )
+    print(f"[calibrate] profile -> {args.profile}")
 
 
 def main() -> None:
     args = parse_args()
+    if args.calibrate:
+        calibrate(args)
+        return
+
+    tuning = {} if args.no_profile else dict(load_profile(args.profile).get("tuning", {}))
+    if tuning:
+        print(f"[render] tuning from {args.profile}: {describe(tuning)}")
+    if args.threads:
+        tuning["threads"] = args.threads
     output_dir = os.path.abspath(args.output_dir)
     os.makedirs(output_dir, exist_ok=True)
-
-    for icon_id in ICON_IDS:
-        out_path = os.path.join(output_dir, f"{icon_id}.png")
+    deferred = args.denoise == "deferred"
+    exr_dir = os.path.abspath(args.exr_dir or os.path.join(output_dir, "_noisy"))
+    if deferred:
+        os.makedirs(exr_dir, exist_ok=True)
+
+    icon_ids = [i.strip() for i in args.only.split(",") if i.strip()] or ICON_IDS
+    unknown = [icon_id for icon_id in icon_ids if icon_id not in BUILDERS]
+    if unknown:
+        raise SystemExit(f"[render] unknown icon ids: {', '.join(unknown)}")
+
+    for icon_id in icon_ids:
+        if deferred:
+            out_path = os.path.join(exr_dir, f"{icon_id}.exr")
+        else:
+            out_path = os.path.join(output_dir, f"{icon_id}.png")
         print(f"[render] {icon_id} -> {out_path}")
-        render_icon(icon_id, out_path, args)
+        render_icon(icon_id, out_path, args, tuning)
+
+    if deferred:
+        print(f"[render] noisy passes in {exr_dir}; run scripts/denoise_hardware_icons_blender.py to write PNGs")
+
+    if args.only or deferred:
+        # Partial renders (e.g. one task per icon from build_assets.py) leave the README alone;
+        # in deferred mode the PNGs (and the README) come from the denoise script.
+        return
 
     readme_path = os.path.join(output_dir, "README.md")
     with open(readme_path, "w", encoding="utf-8") as f:
@@ -0,0 +1,41 @@
+"""
+Regression cases for optimize_card_svgs.py (run with: python -m pytest scripts).
+"""
+
+from __future__ import annotations
+
+from optimize_card_svgs import optimize_svg, round_numbers
+
+
+def wrap(body: str, root_attrs: str = 'xmlns="http://www.w3.org/2000/svg"') -> bytes:
+    return f'<svg {root_attrs} viewBox="0 0 512 512">{body}</svg>'.encode("utf-8")
+
+
+def test_rounded_numbers_do_not_run_together() -> None:
+    assert round_numbers("M1.0.5L2.001.25", 2) == "M1 .5L2 .25"
+    assert round_numbers("3.0004.5 1 1", 2) == "3 .5 1 1"
+    assert round_numbers("M1.2.9996", 2) == "M1.2 1"
+    # Already unambiguous sequences stay compact.
+    assert round_numbers("M1.25.5-3", 2) == "M1.25.5-3"
+
+
+def test_path_and_points_keep_every_coordinate() -> None:
+    out = optimize_svg(wrap('<path d="M1.0.5L2.001.25"/><polyline points="3.0004.5 1 1"/>'), 2)
+    assert b'd="M1 .5L2 .25"' in out
+    assert b'points="3 .5 1 1"' in out
+
+
+def test_svg_prefix_declared_by_document_is_not_reused() -> None:
+    prefixed = wrap(
+        '<svg:rect x="1" width="2" height="2"/>',
+        'xmlns:svg="http://www.w3.org/2000/svg" xmlns="http://www.w3.org/2000/svg"',
+    )
+    assert b"svg:" not in optimize_svg(prefixed, 2)
+    # The process-wide registry must not leak into the next file either.
+    assert optimize_svg(wrap('<rect x="1"/>'), 2).startswith(b'<svg xmlns="http://www.w3.org/2000/svg"')
+
+
+def test_style_blocks_in_defs_are_kept() -> None:
+    out = optimize_svg(wrap('<defs><style>.a{fill:red}</style><linearGradient id="g"/></defs><rect class="a"/>'), 2)
+    assert b"<style>.a{fill:red}</style>" in out
+    assert b"linearGradient" not in out
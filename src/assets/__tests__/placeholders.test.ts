@@ -0,0 +1,37 @@
+import { describe, it, expect } from 'vitest';
+import { decodeBlurhash, getCardPlaceholder } from '../placeholders';
+import { CARD_ART_IDS } from '../cardCatalog';
+
+describe('Card placeholders', () => {
+    describe('decodeBlurhash', () => {
+        it('should match the reference decoder', () => {
+            // First row of the reference blurhash decode of this hash at 8x8
+            const pixels = decodeBlurhash('URG+Rht8$toJt8fRf5fQ$tf5.TozoJfQozfk', 8, 8);
+            expect(Array.from(pixels.slice(0, 12))).toEqual([
+                194, 193, 183, 255,
+                185, 182, 177, 255,
+                163, 153, 161, 255,
+            ]);
+        });
+
+        it('should return opaque RGBA pixels for the requested size', () => {
+            const pixels = decodeBlurhash('URG+Rht8$toJt8fRf5fQ$tf5.TozoJfQozfk', 4, 3);
+            expect(pixels).toHaveLength(4 * 3 * 4);
+            expect(pixels[3]).toBe(255);
+        });
+    });
+
+    describe('getCardPlaceholder', () => {
+        it('should provide a colour and blurhash for every card face', () => {
+            CARD_ART_IDS.forEach((id) => {
+                const placeholder = getCardPlaceholder(id);
+                expect(placeholder?.color).toMatch(/^#[0-9a-f]{6}$/);
+                expect(placeholder?.blurhash).toHaveLength(36);
+            });
+        });
+
+        it('should return undefined for unknown ids', () => {
+            expect(getCardPlaceholder('not-a-card')).toBeUndefined();
+        });
+    });
+});
@@ -14,13 +14,32 @@ import binaryPatternSvg from '@/assets/cards-vivid/binary-pattern.svg';
 import samsungLaptopSilhouetteSvg from '@/assets/cards-vivid/samsung-laptop-silhouette.svg';
 import monitorSilhouetteSvg from '@/assets/cards-vivid/monitor-silhouette.svg';
 import memoryChipSvg from '@/assets/cards-vivid/memory-chip.svg';
+import { CardPlaceholder, getCardPlaceholder } from '@/assets/placeholders';
 
 export interface CardArt {
   id: string;
   label: string;
   src: string;
+  srcSet?: string;
+  placeholder?: CardPlaceholder;
 }
 
+// Pre-baked per-density rasters from scripts/rasterize_card_faces.py (optional).
+const CARD_RASTERS = import.meta.glob<string>('./cards-raster/*.png', {
+  eager: true,
+  import: 'default',
+});
+
+const RASTER_DENSITIES = [1, 2, 3];
+
+const getRasterSrcSet = (id: string): string | undefined => {
+  const entries = RASTER_DENSITIES
+    .map((density) => [density, CARD_RASTERS[`./cards-raster/${id}@${density}x.png`]] as const)
+    .filter(([, url]) => Boolean(url))
+    .map(([density, url]) => `${url} ${density}x`);
+  return entries.length > 0 ? entries.join(', ') : undefined;
+};
+
 const CARD_ART: Record<string, CardArt> = {
   'ram-module': {
     id: 'ram-module',
@@ -104,6 +123,11 @@ const CARD_ART: Record<string, CardArt> = {
   },
 };
 
+Object.values(CARD_ART).forEach((art) => {
+  art.srcSet = getRasterSrcSet(art.id);
+  art.placeholder = getCardPlaceholder(art.id);
+});
+
 export const CARD_ART_IDS = Object.keys(CARD_ART);
 
 export const getCardArt = (id: string): CardArt => {
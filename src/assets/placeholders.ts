@@ -0,0 +1,100 @@
+import placeholderData from '@/assets/iconPlaceholders.json';
+
+// Placeholders precomputed by scripts/analyze_icon_faces.py from the 1x card rasters.
+
+export interface CardPlaceholder {
+  color: string;
+  blurhash: string;
+}
+
+interface PlaceholderEntry {
+  average: string;
+  blurhash: string;
+}
+
+const ICONS = placeholderData.icons as Record<string, { card?: PlaceholderEntry }>;
+
+export const getCardPlaceholder = (id: string): CardPlaceholder | undefined => {
+  const entry = ICONS[id]?.card;
+  return entry ? { color: entry.average, blurhash: entry.blurhash } : undefined;
+};
+
+const BASE83 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~';
+
+const decode83 = (value: string): number =>
+  Array.from(value).reduce((result, char) => result * 83 + BASE83.indexOf(char), 0);
+
+const srgbToLinear = (value: number): number => {
+  const v = value / 255;
+  return v <= 0.04045 ? v / 12.92 : ((v + 0.055) / 1.055) ** 2.4;
+};
+
+const linearToSrgb = (value: number): number => {
+  const v = Math.min(Math.max(value, 0), 1);
+  return Math.round(v <= 0.0031308 ? v * 12.92 * 255 : (1.055 * v ** (1 / 2.4) - 0.055) * 255);
+};
+
+const signPow = (value: number, exp: number): number => Math.sign(value) * Math.abs(value) ** exp;
+
+export const decodeBlurhash = (hash: string, width: number, height: number): Uint8ClampedArray => {
+  const sizeFlag = decode83(hash[0]);
+  const componentsX = (sizeFlag % 9) + 1;
+  const componentsY = Math.floor(sizeFlag / 9) + 1;
+  const maxValue = (decode83(hash[1]) + 1) / 166;
+
+  const colors: number[][] = [];
+  const dc = decode83(hash.slice(2, 6));
+  colors.push([srgbToLinear(dc >> 16), srgbToLinear((dc >> 8) & 255), srgbToLinear(dc & 255)]);
+  for (let i = 1; i < componentsX * componentsY; i++) {
+    const ac = decode83(hash.slice(4 + i * 2, 6 + i * 2));
+    colors.push(
+      [Math.floor(ac / 361), Math.floor(ac / 19) % 19, ac % 19].map(
+        (q) => signPow((q - 9) / 9, 2) * maxValue,
+      ),
+    );
+  }
+
+  const pixels = new Uint8ClampedArray(width * height * 4);
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      let r = 0;
+      let g = 0;
+      let b = 0;
+      for (let j = 0; j < componentsY; j++) {
+        for (let i = 0; i < componentsX; i++) {
+          const basis = Math.cos((Math.PI * x * i) / width) * Math.cos((Math.PI * y * j) / height);
+          const color = colors[i + j * componentsX];
+          r += color[0] * basis;
+          g += color[1] * basis;
+          b += color[2] * basis;
+        }
+      }
+      const offset = (y * width + x) * 4;
+      pixels[offset] = linearToSrgb(r);
+      pixels[offset + 1] = linearToSrgb(g);
+      pixels[offset + 2] = linearToSrgb(b);
+      pixels[offset + 3] = 255;
+    }
+  }
+  return pixels;
+};
+
+const dataUrls = new Map<string, string | undefined>();
+
+// A 32px image is plenty for a blur; the browser scales it up with smoothing.
+export const blurhashToDataUrl = (hash: string, size = 32): string | undefined => {
+  if (dataUrls.has(hash)) return dataUrls.get(hash);
+  let url: string | undefined;
+  const canvas = typeof document !== 'undefined' ? document.createElement('canvas') : undefined;
+  const context = canvas?.getContext('2d');
+  if (canvas && context) {
+    canvas.width = size;
+    canvas.height = size;
+    const image = context.createImageData(size, size);
+    image.data.set(decodeBlurhash(hash, size, size));
+    context.putImageData(image, 0, 0);
+    url = canvas.toDataURL();
+  }
+  dataUrls.set(hash, url);
+  return url;
+};
@@ -4,9 +4,10 @@
  * Optimized for 60 FPS on tablet devices
  */
 
-import React, { memo, useCallback, useRef, useEffect } from 'react';
+import React, { memo, useCallback, useRef, useEffect, useMemo, useState } from 'react';
 import { Card as CardType } from '@/types';
 import { getCardArt } from '@/assets/cardCatalog';
+import { blurhashToDataUrl } from '@/assets/placeholders';
 import './Card.css';
 
 // ============================================================================
@@ -72,6 +73,18 @@ export const Card = memo<CardProps>(({
   // Size class mapping
   const sizeClass = `card--${size}`;
   const cardArt = getCardArt(card.emoji);
+
+  // Paint the precomputed colour/blurhash until the art has decoded
+  const [artLoaded, setArtLoaded] = useState(false);
+  const placeholderStyle = useMemo<React.CSSProperties | undefined>(() => {
+    if (!cardArt.placeholder) return undefined;
+    const blurUrl = blurhashToDataUrl(cardArt.placeholder.blurhash);
+    return {
+      backgroundColor: cardArt.placeholder.color,
+      backgroundImage: blurUrl ? `url(${blurUrl})` : undefined,
+    };
+  }, [cardArt.placeholder]);
+  const handleArtLoad = useCallback(() => setArtLoaded(true), []);
   
   // State classes
   const stateClasses = [
@@ -112,9 +125,12 @@ export const Card = memo<CardProps>(({
         <div className="card__face card__face--back">
           <div className="card__content">
             <img
-              className="card__art"
+              className={`card__art ${!artLoaded && placeholderStyle ? 'card__art--placeholder' : ''}`}
               src={cardArt.src}
+              srcSet={cardArt.srcSet}
               alt={cardArt.label}
+              style={artLoaded ? undefined : placeholderStyle}
+              onLoad={handleArtLoad}
               draggable={false}
             />
           </div>